@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException, Query, Request
+import logging
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from redis.exceptions import RedisError
 
 from app.config import settings
 from app.providers.odds_api import odds_api_provider
 from app.schemas.common import Market, Region
 from app.schemas.odds_movements import OddsMovementsResponse
+from app.services.cache import cache_service
 from app.services.rate_limiter import limiter
 from app.services.region_filter import (
     get_allowed_bookmakers,
@@ -11,8 +16,13 @@ from app.services.region_filter import (
     validate_bookmaker_access,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Line markets change slowly enough to serve pre-serialized responses from cache
+CACHED_RESPONSE_MARKETS = {Market.ASIAN_HANDICAP, Market.TOTALS}
+
 
 @router.get("")
 @limiter.limit(settings.rate_limit_default)
@@ -31,11 +41,36 @@ async def get_odds(
     requested_bm = bookmakers.split(",") if bookmakers else None
     bm_list = get_bookmakers_for_region(region, requested_bm)
 
-    return await odds_api_provider.get_odds(
-        event_id=event_id,
-        bookmakers=bm_list,
-        market=market.value,
-    )
+    if market not in CACHED_RESPONSE_MARKETS:
+        return await odds_api_provider.get_odds(
+            event_id=event_id,
+            bookmakers=bm_list,
+            market=market.value,
+        )
+
+    # Serve the cached JSON body directly, skipping pydantic serialization.
+    # Redis being unavailable only costs the shortcut, never the response.
+    cache_key = f"odds:response:{event_id}:{market.value}:{','.join(bm_list)}"
+    try:
+        raw = await cache_service.get_raw(cache_key)
+    except RedisError as e:
+        logger.warning(f"Odds response cache unavailable for {cache_key}: {e}")
+        raw = None
+    if raw is None:
+        result = await odds_api_provider.get_odds(
+            event_id=event_id,
+            bookmakers=bm_list,
+            market=market.value,
+        )
+        if result is None:
+            return None
+        raw = orjson.dumps(result.model_dump(mode="json"))
+        try:
+            await cache_service.set_raw(cache_key, raw, ttl=settings.cache_ttl_odds)
+        except RedisError as e:
+            logger.warning(f"Failed to cache odds response {cache_key}: {e}")
+
+    return Response(content=raw, media_type="application/json")
 
 
 @router.get("/multi")
@@ -38,6 +38,7 @@ from app.db import async_session_maker
 from app.services import api_key_service
 from app.services.cache import cache_service
 from app.services.metrics import metrics_service
+from app.services.odds_client import odds_client
 from app.services.rate_limiter import limiter
 
 logging.basicConfig(level=logging.INFO)
@@ -53,9 +54,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to connect to Redis: {e}. Background tasks disabled.")
         app.state.arq_pool = None
+    try:
+        await odds_client.prime_metadata()
+    except Exception as e:
+        logger.warning(f"Failed to prime metadata cache: {e}")
     yield
     # Shutdown
     await cache_service.close()
+    await odds_client.close()
     if app.state.arq_pool:
         await app.state.arq_pool.close()
     logger.info("Shutting down nsn-odds-data service")
@@ -76,21 +76,21 @@ class RequestData(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    def needs_refresh(self) -> bool:
-        """Check if this request needs to be refreshed based on frequency."""
+    def next_refresh_at(self, refreshed_at: datetime | None) -> float | None:
+        """Next refresh time (unix seconds) after a refresh at refreshed_at.
+
+        Returns 0.0 (due now) if never refreshed, None once no refresh is needed.
+        """
         if self.is_ended:
-            return False
+            return None
 
         frequency = RefreshFrequency.for_event_date(self.event_date)
         if frequency == RefreshFrequency.NONE:
-            return False
-
-        if self.last_refreshed is None:
-            return True
+            return None
 
-        now = datetime.now(self.last_refreshed.tzinfo) if self.last_refreshed.tzinfo else datetime.now()
-        elapsed = (now - self.last_refreshed).total_seconds()
-        return elapsed >= frequency.get_interval_seconds()
+        if refreshed_at is None:
+            return 0.0
+        return refreshed_at.timestamp() + frequency.get_interval_seconds()
 
     static_files: Mapped[list["StaticFile"]] = relationship(
         "StaticFile", back_populates="request_data", cascade="all, delete-orphan"
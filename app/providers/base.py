@@ -38,6 +38,6 @@ class ProviderInterface(ABC):
         ...
 
     @abstractmethod
-    def compute_hash(self, data: dict[str, Any]) -> str:
-        """Compute hash for change detection."""
+    def compute_hash(self, data: bytes) -> str:
+        """Compute hash of serialized data for change detection."""
         ...
@@ -1,5 +1,4 @@
 import hashlib
-import json
 from typing import Any
 
 from app.config import settings
@@ -168,11 +167,9 @@ class OddsAPIProvider(ProviderInterface):
         """Get a single participant by ID."""
         return await odds_client.get_participant(participant_id)
 
-    def compute_hash(self, data: dict[str, Any]) -> str:
-        """Compute MD5 hash of odds data for change detection."""
-        # Only hash the relevant changing parts (odds values)
-        hash_content = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.md5(hash_content.encode()).hexdigest()
+    def compute_hash(self, data: bytes) -> str:
+        """Compute BLAKE2b-128 hash of serialized odds data for change detection."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 odds_api_provider = OddsAPIProvider()
@@ -1,6 +1,6 @@
-import json
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 from app.config import settings
@@ -37,12 +37,48 @@ class CacheService:
                 await metrics_service.track_cache_miss()
 
         if value:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
 
+    async def get_many(self, keys: list[str], track_metrics: bool = True) -> list[Any | None]:
+        """Get several keys in a single MGET round-trip (None for missing keys)."""
+        if not keys:
+            return []
+        client = await self.get_client()
+        values = await client.mget(keys)
+
+        if track_metrics:
+            from app.services.metrics import metrics_service
+            hits = sum(1 for v in values if v)
+            if hits:
+                await metrics_service.track_cache_hit(hits)
+            if hits < len(values):
+                await metrics_service.track_cache_miss(len(values) - hits)
+
+        return [orjson.loads(v) if v else None for v in values]
+
+    async def get_raw(self, key: str, track_metrics: bool = True) -> str | None:
+        """Get the cached JSON document as-is, without decoding it."""
+        client = await self.get_client()
+        value = await client.get(key)
+
+        if track_metrics:
+            from app.services.metrics import metrics_service
+            if value:
+                await metrics_service.track_cache_hit()
+            else:
+                await metrics_service.track_cache_miss()
+
+        return value or None
+
+    async def set_raw(self, key: str, raw: bytes | str, ttl: int | None = None) -> None:
+        """Store an already-serialized JSON document."""
+        client = await self.get_client()
+        await client.set(key, raw, ex=ttl)
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         client = await self.get_client()
-        await client.set(key, json.dumps(value), ex=ttl)
+        await client.set(key, orjson.dumps(value), ex=ttl)
 
     async def delete(self, key: str) -> None:
         client = await self.get_client()
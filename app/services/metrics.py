@@ -54,13 +54,13 @@ class MetricsService:
         await self.increment(KEY_LATENCY_SUM, int(latency_ms))
         await self.increment(KEY_LATENCY_COUNT)
 
-    async def track_cache_hit(self) -> None:
-        """Track a cache hit."""
-        await self.increment(KEY_CACHE_HITS)
+    async def track_cache_hit(self, count: int = 1) -> None:
+        """Track cache hit(s)."""
+        await self.increment(KEY_CACHE_HITS, count)
 
-    async def track_cache_miss(self) -> None:
-        """Track a cache miss."""
-        await self.increment(KEY_CACHE_MISSES)
+    async def track_cache_miss(self, count: int = 1) -> None:
+        """Track cache miss(es)."""
+        await self.increment(KEY_CACHE_MISSES, count)
 
     async def track_api_call(self) -> None:
         """Track an external API call."""
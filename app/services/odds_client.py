@@ -1,12 +1,19 @@
 import asyncio
 import logging
+import math
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 import httpx
+import orjson
 
 from app.config import settings
 from app.exceptions import (
+    OddsAPIError,
     ProviderError,
     ProviderTimeoutError,
     RateLimitError,
@@ -59,6 +66,64 @@ from app.services.cache import cache_service
 
 logger = logging.getLogger(__name__)
 
+# Map internal market names to API market names
+_API_MARKET_NAMES = {
+    "1x2": "ML",
+    "asian_handicap": "Asian Handicap",
+    "totals": "Totals",
+    "btts": "Both Teams to Score",
+    "correct_score": "Correct Score",
+    "double_chance": "Double Chance",
+}
+
+# Market name aliases accepted in upstream bookmaker payloads, per market
+_ML_MARKETS = frozenset({"ML", "1x2", "h2h"})
+_AH_MARKETS = frozenset({"Asian Handicap", "AH", "asian_handicap"})
+_TOTALS_MARKETS = frozenset({"Totals", "Over/Under", "totals"})
+_BTTS_MARKETS = frozenset({"Both Teams to Score", "BTTS", "btts"})
+_CORRECT_SCORE_MARKETS = frozenset({"Correct Score", "correct_score"})
+_DOUBLE_CHANCE_MARKETS = frozenset({"Double Chance", "double_chance"})
+
+# Odds payloads with more bookmakers than this are transformed off the event loop
+_OFFLOAD_MIN_BOOKMAKERS = 16
+
+# Long-lived metadata endpoints whose fresh entries are also kept in process memory
+_LOCAL_CACHE_ENDPOINTS = frozenset({"/sports", "/bookmakers", "/leagues"})
+
+# Max in-process metadata entries (leagues are keyed by the caller-supplied sport)
+_LOCAL_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=256)
+def _normalize_bm_key(name: str) -> str:
+    """Normalize a bookmaker display name to its key (e.g. "William Hill" -> "william_hill")."""
+    return name.lower().replace(" ", "_")
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp (quotes are updated in batches, so values repeat a lot)."""
+    return datetime.fromisoformat(value)
+
+
+def _parse_event_data(data: dict[str, Any]) -> EventData:
+    """Extract event info shared by all odds transformers (handles nested sport/league)."""
+    sport_data = data.get("sport", {})
+    league_data = data.get("league", {})
+    date_str = data.get("date", data.get("commence_time", ""))
+    sport_is_dict = isinstance(sport_data, dict)
+    league_is_dict = isinstance(league_data, dict)
+
+    return EventData(
+        id=str(data.get("id", "")),
+        sport=sport_data.get("slug", "football") if sport_is_dict else str(sport_data),
+        league=league_data.get("name") if league_is_dict else data.get("league"),
+        league_id=league_data.get("id") if league_is_dict else data.get("leagueId"),
+        home_team=data.get("home", data.get("home_team", "")),
+        away_team=data.get("away", data.get("away_team", "")),
+        commence_time=_parse_ts(date_str) if date_str else datetime.now(),
+    )
+
 
 class OddsAPIClient:
     """HTTP client for Odds-API.io with caching."""
@@ -66,6 +131,29 @@ class OddsAPIClient:
     def __init__(self):
         self.base_url = settings.odds_api_base_url
         self.api_key = settings.odds_api_key
+        self._refreshing: set[str] = set()
+        self._background_tasks: set[asyncio.Task] = set()
+        self._client: httpx.AsyncClient | None = None
+        self._local_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._rate_limited_until = 0.0
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client (keeps upstream connections alive across calls)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                params={"apiKey": self.api_key},
+                headers={"Accept": "application/json"},
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=True,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     async def _request(
         self,
@@ -74,34 +162,107 @@ class OddsAPIClient:
         cache_key: str | None = None,
         cache_ttl: int | None = None,
     ) -> dict[str, Any] | list[Any] | None:
-        """Make an HTTP request with optional caching."""
+        """Make an HTTP request with optional caching.
+
+        Cache entries are kept for `settings.cache_stale_ttl` seconds past their
+        TTL. An expired entry is returned immediately while a background task
+        refreshes it, and is used as a fallback when Odds-API.io is unavailable.
+
+        Fresh entries for `_LOCAL_CACHE_ENDPOINTS` are also kept in process
+        memory until their `fresh_until`, so hot metadata skips the Redis round-trip.
+        """
         # Check cache first
+        entry: dict[str, Any] | None = None
         if cache_key:
+            local = self._local_cache.get(cache_key)
+            if local is not None:
+                if local["fresh_until"] > time.time():
+                    self._local_cache.move_to_end(cache_key)
+                    return local["data"]
+                del self._local_cache[cache_key]
+
             cached = await cache_service.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Cache hit for {cache_key}")
-                return cached
+            if isinstance(cached, dict) and "fresh_until" in cached:
+                entry = cached
+
+            if entry is not None:
+                if entry["fresh_until"] > time.time():
+                    logger.debug(f"Cache hit for {cache_key}")
+                    self._remember(endpoint, cache_key, entry)
+                    return entry["data"]
+                if cache_ttl:
+                    logger.debug(f"Stale cache hit for {cache_key}, refreshing in background")
+                    self._schedule_refresh(endpoint, params, cache_key, cache_ttl, entry)
+                    return entry["data"]
+
+        try:
+            return await self._fetch(endpoint, params, cache_key, cache_ttl, entry)
+        except OddsAPIError as e:
+            client_error = isinstance(e, ProviderError) and (e.status_code or 500) < 500
+            if entry is None or client_error:
+                raise
+            logger.warning(f"Odds-API.io unavailable for {endpoint}, serving stale cache: {e.message}")
+            return entry["data"]
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        cache_key: str | None = None,
+        cache_ttl: int | None = None,
+        cached: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Call Odds-API.io and store the response in cache.
 
-        # Build request
-        url = f"{self.base_url}{endpoint}"
-        request_params = {"apiKey": self.api_key}
-        if params:
-            request_params.update(params)
+        If the previous cache entry carries an ETag, the request is made
+        conditional and a 304 reuses the cached body instead of re-downloading it.
+
+        After a 429, calls fail fast with RateLimitError until Retry-After has
+        elapsed, so concurrent callers don't keep hitting the rate-limited API.
+        """
+        blocked_for = self._rate_limited_until - time.monotonic()
+        if blocked_for > 0:
+            raise RateLimitError(
+                "Odds-API.io rate limit exceeded",
+                retry_after=math.ceil(blocked_for),
+            )
+
+        # The API key and default headers live on the shared client; only the
+        # conditional header varies per call
+        headers = None
+        if cached and cached.get("etag"):
+            headers = {"If-None-Match": cached["etag"]}
 
         try:
             # Track external API call
             await metrics_service.track_api_call()
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=request_params)
+            client = await self._get_client()
+            started = time.perf_counter()
+            response = await client.get(endpoint, params=params, headers=headers)
+            elapsed = time.perf_counter() - started
+            etag = response.headers.get("ETag")
+            if response.status_code == 304 and cached:
+                logger.debug(f"Not modified: {cache_key}")
+                data = cached["data"]
+                # A 304 may omit the ETag; keep revalidating against the cached one
+                etag = etag or cached["etag"]
+            else:
                 response.raise_for_status()
-                data = response.json()
-
-                # Cache if key provided
-                if cache_key and cache_ttl:
-                    await cache_service.set(cache_key, data, cache_ttl)
-
-                return data
+                data = orjson.loads(response.content)
+
+            # Cache if key provided
+            if cache_key and cache_ttl:
+                ttl = self._effective_ttl(cache_ttl, elapsed)
+                entry = {
+                    "data": data,
+                    "fresh_until": time.time() + ttl,
+                    "etag": etag,
+                }
+                await cache_service.set(cache_key, entry, ttl + settings.cache_stale_ttl)
+                self._remember(endpoint, cache_key, entry)
+
+            return data
         except httpx.TimeoutException:
             raise ProviderTimeoutError(
                 f"Request to {endpoint} timed out",
@@ -113,9 +274,11 @@ class OddsAPIClient:
             body = e.response.text[:500]
 
             if status == 429:
+                retry_after = int(e.response.headers.get("Retry-After", 60))
+                self._rate_limited_until = time.monotonic() + retry_after
                 raise RateLimitError(
                     "Odds-API.io rate limit exceeded",
-                    retry_after=int(e.response.headers.get("Retry-After", 60)),
+                    retry_after=retry_after,
                 )
 
             raise ProviderError(
@@ -130,6 +293,59 @@ class OddsAPIClient:
                 endpoint=endpoint,
             )
 
+    def _remember(self, endpoint: str, cache_key: str, entry: dict[str, Any]) -> None:
+        """Keep a fresh cache entry in process memory if its endpoint is eligible.
+
+        The least recently used entry is evicted past `_LOCAL_CACHE_SIZE`.
+        """
+        if endpoint in _LOCAL_CACHE_ENDPOINTS:
+            self._local_cache[cache_key] = entry
+            self._local_cache.move_to_end(cache_key)
+            if len(self._local_cache) > _LOCAL_CACHE_SIZE:
+                self._local_cache.popitem(last=False)
+
+    @staticmethod
+    def _effective_ttl(cache_ttl: int, elapsed: float) -> int:
+        """Extend the TTL of slow responses so a struggling upstream is hit less often.
+
+        The TTL grows with the observed response time (elapsed x
+        `cache_ttl_latency_factor`), never below the endpoint's own TTL and
+        never above `cache_ttl_max`.
+        """
+        adaptive = int(elapsed * settings.cache_ttl_latency_factor)
+        return min(settings.cache_ttl_max, max(cache_ttl, adaptive))
+
+    def _schedule_refresh(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        cache_key: str,
+        cache_ttl: int,
+        cached: dict[str, Any],
+    ) -> None:
+        """Refresh a stale cache entry in the background (one refresh per key)."""
+        if cache_key in self._refreshing:
+            return
+        self._refreshing.add(cache_key)
+        task = asyncio.create_task(self._refresh(endpoint, params, cache_key, cache_ttl, cached))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        cache_key: str,
+        cache_ttl: int,
+        cached: dict[str, Any],
+    ) -> None:
+        try:
+            await self._fetch(endpoint, params, cache_key, cache_ttl, cached)
+        except OddsAPIError as e:
+            logger.warning(f"Background refresh failed for {cache_key}: {e.message}")
+        finally:
+            self._refreshing.discard(cache_key)
+
     async def get_sports(self) -> list[dict[str, Any]]:
         """GET /sports - List available sports."""
         data = await self._request(
@@ -148,6 +364,36 @@ class OddsAPIClient:
         )
         return data if isinstance(data, list) else []
 
+    async def prime_metadata(self) -> dict[str, list[dict[str, Any]]]:
+        """Load sports, bookmakers and leagues with a single Redis MGET.
+
+        Fresh hits are kept in process memory like any other metadata read;
+        keys missing from cache (or expired) are fetched from Odds-API.io in parallel.
+
+        Returns: {"sports": [...], "bookmakers": [...], "leagues": [...]}
+        """
+        loaders = {
+            "sports": ("/sports", "sports:all", self.get_sports),
+            "bookmakers": ("/bookmakers", "bookmakers:all", self.get_bookmakers),
+            "leagues": ("/leagues", "leagues:all", self.get_leagues),
+        }
+        entries = await cache_service.get_many([key for _, key, _ in loaders.values()])
+
+        results: dict[str, list[dict[str, Any]]] = {}
+        missing = []
+        now = time.time()
+        for (name, (endpoint, key, loader)), entry in zip(loaders.items(), entries):
+            if isinstance(entry, dict) and entry.get("fresh_until", 0) > now:
+                self._remember(endpoint, key, entry)
+                data = entry["data"]
+                results[name] = data if isinstance(data, list) else []
+            else:
+                missing.append((name, loader))
+
+        fetched = await asyncio.gather(*(loader() for _, loader in missing))
+        results.update((name, data) for (name, _), data in zip(missing, fetched))
+        return results
+
     async def get_event(self, event_id: str) -> EventResponse | None:
         """GET /events/{id} - Get a single event by ID."""
         cache_key = f"event:{event_id}"
@@ -177,7 +423,7 @@ class OddsAPIClient:
                 id=str(data.get("id", "")),
                 home=data.get("home", data.get("home_team", "")),
                 away=data.get("away", data.get("away_team", "")),
-                date=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
+                date=_parse_ts(date_str) if date_str else datetime.now(),
                 status=event_status,
                 sport=SportInfo(
                     name=sport_data.get("name", "Football") if isinstance(sport_data, dict) else "Football",
@@ -257,7 +503,7 @@ class OddsAPIClient:
                         id=str(item.get("id", "")),
                         home=item.get("home", item.get("home_team", "")),
                         away=item.get("away", item.get("away_team", "")),
-                        date=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
+                        date=_parse_ts(date_str) if date_str else datetime.now(),
                         status=event_status,
                         sport=SportInfo(
                             name=sport_data.get("name", "Football") if isinstance(sport_data, dict) else "Football",
@@ -305,7 +551,7 @@ class OddsAPIClient:
                         id=str(item.get("id", "")),
                         home=item.get("home", ""),
                         away=item.get("away", ""),
-                        date=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
+                        date=_parse_ts(date_str) if date_str else datetime.now(),
                         status=EventStatus.IN_PROGRESS,
                         scores=ScoreInfo(home=scores.get("home", 0), away=scores.get("away", 0)) if scores else None,
                         sport=SportInfo(
@@ -357,17 +603,12 @@ class OddsAPIClient:
         bookmakers: list[str],
         market: str = "1x2",
     ) -> OddsOutput | AsianHandicapOutput | TotalsOutput | BTTSOutput | CorrectScoreOutput | DoubleChanceOutput | None:
-        """GET /odds - Get odds for a specific event."""
-        # Map internal market names to API market names
-        market_mapping = {
-            "1x2": "ML",
-            "asian_handicap": "Asian Handicap",
-            "totals": "Totals",
-            "btts": "Both Teams to Score",
-            "correct_score": "Correct Score",
-            "double_chance": "Double Chance",
-        }
-        api_market = market_mapping.get(market, market)
+        """GET /odds - Get odds for a specific event.
+
+        Payloads covering more than `_OFFLOAD_MIN_BOOKMAKERS` bookmakers are
+        transformed in a worker thread so large responses don't stall the event loop.
+        """
+        api_market = _API_MARKET_NAMES.get(market, market)
 
         params = {
             "eventId": event_id,
@@ -390,9 +631,13 @@ class OddsAPIClient:
             "double_chance": self._transform_double_chance,
         }
         transformer = transformers.get(market)
-        if transformer:
-            return transformer(data)
-        return self._transform_odds(data, market)
+        args = (data,) if transformer else (data, market)
+        transformer = transformer or self._transform_odds
+
+        bookmakers_data = data.get("bookmakers") if isinstance(data, dict) else None
+        if bookmakers_data and len(bookmakers_data) > _OFFLOAD_MIN_BOOKMAKERS:
+            return await asyncio.to_thread(transformer, *args)
+        return transformer(*args)
 
     def _transform_odds(self, data: dict[str, Any], market: str) -> OddsOutput | None:
         """Transform API response to OddsOutput format.
@@ -412,20 +657,7 @@ class OddsAPIClient:
         }
         """
         try:
-            # Extract event info - handle nested sport/league
-            sport_data = data.get("sport", {})
-            league_data = data.get("league", {})
-            date_str = data.get("date", data.get("commence_time", ""))
-
-            event = EventData(
-                id=str(data.get("id", "")),
-                sport=sport_data.get("slug", "football") if isinstance(sport_data, dict) else str(sport_data),
-                league=league_data.get("name") if isinstance(league_data, dict) else data.get("league"),
-                league_id=league_data.get("id") if isinstance(league_data, dict) else data.get("leagueId"),
-                home_team=data.get("home", data.get("home_team", "")),
-                away_team=data.get("away", data.get("away_team", "")),
-                commence_time=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
-            )
+            event = _parse_event_data(data)
 
             # Extract bookmaker odds - API returns dict, not list
             bookmakers_data = data.get("bookmakers", {})
@@ -434,12 +666,12 @@ class OddsAPIClient:
             # Handle dict format: {"Bet365": [...], "Betano": [...]}
             if isinstance(bookmakers_data, dict):
                 for bm_name, markets in bookmakers_data.items():
-                    if not isinstance(markets, list):
+                    if type(markets) is not list:
                         continue
 
                     # Find ML (Match Line / 1x2) market
                     ml_market = next(
-                        (m for m in markets if m.get("name") in ["ML", "1x2", "h2h"]),
+                        (m for m in markets if m.get("name") in _ML_MARKETS),
                         None,
                     )
 
@@ -465,10 +697,10 @@ class OddsAPIClient:
                         updated_str = ml_market.get("updatedAt", "")
                         bookmaker_odds.append(
                             BookmakerOdds(
-                                key=bm_name.lower().replace(" ", "_"),
+                                key=_normalize_bm_key(bm_name),
                                 name=bm_name,
-                                odds=OddsValues(home=home_odds, draw=draw_odds, away=away_odds),
-                                updated_at=datetime.fromisoformat(updated_str.replace("Z", "+00:00")) if updated_str else datetime.now(),
+                                odds=OddsValues.model_construct(home=home_odds, draw=draw_odds, away=away_odds),
+                                updated_at=_parse_ts(updated_str) if updated_str else datetime.now(),
                             )
                         )
 
@@ -477,7 +709,7 @@ class OddsAPIClient:
                 for bm in bookmakers_data:
                     markets = bm.get("markets", [])
                     h2h_market = next(
-                        (m for m in markets if m.get("key") in ["h2h", "1x2", "ML"]),
+                        (m for m in markets if m.get("key") in _ML_MARKETS),
                         None,
                     )
                     if not h2h_market:
@@ -498,9 +730,9 @@ class OddsAPIClient:
                             BookmakerOdds(
                                 key=bm.get("key", ""),
                                 name=bm.get("title", bm.get("key", "")),
-                                odds=OddsValues(**odds_map),
-                                updated_at=datetime.fromisoformat(
-                                    h2h_market.get("last_update", "").replace("Z", "+00:00")
+                                odds=OddsValues.model_construct(**odds_map),
+                                updated_at=_parse_ts(
+                                    h2h_market.get("last_update", "")
                                 ) if h2h_market.get("last_update") else datetime.now(),
                             )
                         )
@@ -541,20 +773,7 @@ class OddsAPIClient:
         }
         """
         try:
-            # Extract event info
-            sport_data = data.get("sport", {})
-            league_data = data.get("league", {})
-            date_str = data.get("date", data.get("commence_time", ""))
-
-            event = EventData(
-                id=str(data.get("id", "")),
-                sport=sport_data.get("slug", "football") if isinstance(sport_data, dict) else str(sport_data),
-                league=league_data.get("name") if isinstance(league_data, dict) else data.get("league"),
-                league_id=league_data.get("id") if isinstance(league_data, dict) else data.get("leagueId"),
-                home_team=data.get("home", data.get("home_team", "")),
-                away_team=data.get("away", data.get("away_team", "")),
-                commence_time=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
-            )
+            event = _parse_event_data(data)
 
             # Extract Asian Handicap odds
             bookmakers_data = data.get("bookmakers", {})
@@ -562,12 +781,12 @@ class OddsAPIClient:
 
             if isinstance(bookmakers_data, dict):
                 for bm_name, markets in bookmakers_data.items():
-                    if not isinstance(markets, list):
+                    if type(markets) is not list:
                         continue
 
                     # Find Asian Handicap market
                     ah_market = next(
-                        (m for m in markets if m.get("name") in ["Asian Handicap", "AH", "asian_handicap"]),
+                        (m for m in markets if m.get("name") in _AH_MARKETS),
                         None,
                     )
 
@@ -578,8 +797,11 @@ class OddsAPIClient:
                     if not odds_list:
                         continue
 
-                    # Parse all handicap lines
+                    # Parse all handicap lines (values are already coerced to float,
+                    # so skip per-line pydantic validation)
                     lines = []
+                    prev = float("-inf")
+                    needs_sort = False
                     for odds_entry in odds_list:
                         try:
                             hdp = float(odds_entry.get("hdp", 0))
@@ -587,8 +809,11 @@ class OddsAPIClient:
                             away_odds = float(odds_entry.get("away", 0))
 
                             if home_odds > 0 and away_odds > 0:
+                                if hdp < prev:
+                                    needs_sort = True
+                                prev = hdp
                                 lines.append(
-                                    AsianHandicapLine(
+                                    AsianHandicapLine.model_construct(
                                         hdp=hdp,
                                         home=home_odds,
                                         away=away_odds,
@@ -598,16 +823,17 @@ class OddsAPIClient:
                             continue
 
                     if lines:
-                        # Sort lines by handicap value
-                        lines.sort(key=lambda x: x.hdp)
+                        # Sort lines by handicap value (upstream usually sends them in order)
+                        if needs_sort:
+                            lines.sort(key=attrgetter("hdp"))
 
                         updated_str = ah_market.get("updatedAt", "")
                         bookmaker_odds.append(
                             AsianHandicapBookmaker(
-                                key=bm_name.lower().replace(" ", "_"),
+                                key=_normalize_bm_key(bm_name),
                                 name=bm_name,
                                 lines=lines,
-                                updated_at=datetime.fromisoformat(updated_str.replace("Z", "+00:00")) if updated_str else datetime.now(),
+                                updated_at=_parse_ts(updated_str) if updated_str else datetime.now(),
                             )
                         )
 
@@ -646,20 +872,7 @@ class OddsAPIClient:
         }
         """
         try:
-            # Extract event info
-            sport_data = data.get("sport", {})
-            league_data = data.get("league", {})
-            date_str = data.get("date", data.get("commence_time", ""))
-
-            event = EventData(
-                id=str(data.get("id", "")),
-                sport=sport_data.get("slug", "football") if isinstance(sport_data, dict) else str(sport_data),
-                league=league_data.get("name") if isinstance(league_data, dict) else data.get("league"),
-                league_id=league_data.get("id") if isinstance(league_data, dict) else data.get("leagueId"),
-                home_team=data.get("home", data.get("home_team", "")),
-                away_team=data.get("away", data.get("away_team", "")),
-                commence_time=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
-            )
+            event = _parse_event_data(data)
 
             # Extract Totals odds
             bookmakers_data = data.get("bookmakers", {})
@@ -667,12 +880,12 @@ class OddsAPIClient:
 
             if isinstance(bookmakers_data, dict):
                 for bm_name, markets in bookmakers_data.items():
-                    if not isinstance(markets, list):
+                    if type(markets) is not list:
                         continue
 
                     # Find Totals market
                     totals_market = next(
-                        (m for m in markets if m.get("name") in ["Totals", "Over/Under", "totals"]),
+                        (m for m in markets if m.get("name") in _TOTALS_MARKETS),
                         None,
                     )
 
@@ -685,6 +898,8 @@ class OddsAPIClient:
 
                     # Parse all totals lines
                     lines = []
+                    prev = float("-inf")
+                    needs_sort = False
                     for odds_entry in odds_list:
                         try:
                             line = float(odds_entry.get("line", odds_entry.get("hdp", 0)))
@@ -692,8 +907,11 @@ class OddsAPIClient:
                             under_odds = float(odds_entry.get("under", 0))
 
                             if over_odds > 0 and under_odds > 0:
+                                if line < prev:
+                                    needs_sort = True
+                                prev = line
                                 lines.append(
-                                    TotalsLine(
+                                    TotalsLine.model_construct(
                                         line=line,
                                         over=over_odds,
                                         under=under_odds,
@@ -703,16 +921,17 @@ class OddsAPIClient:
                             continue
 
                     if lines:
-                        # Sort lines by line value
-                        lines.sort(key=lambda x: x.line)
+                        # Sort lines by line value (upstream usually sends them in order)
+                        if needs_sort:
+                            lines.sort(key=attrgetter("line"))
 
                         updated_str = totals_market.get("updatedAt", "")
                         bookmaker_odds.append(
                             TotalsBookmaker(
-                                key=bm_name.lower().replace(" ", "_"),
+                                key=_normalize_bm_key(bm_name),
                                 name=bm_name,
                                 lines=lines,
-                                updated_at=datetime.fromisoformat(updated_str.replace("Z", "+00:00")) if updated_str else datetime.now(),
+                                updated_at=_parse_ts(updated_str) if updated_str else datetime.now(),
                             )
                         )
 
@@ -736,30 +955,18 @@ class OddsAPIClient:
     def _transform_btts(self, data: dict[str, Any]) -> BTTSOutput | None:
         """Transform API response to BTTSOutput format."""
         try:
-            sport_data = data.get("sport", {})
-            league_data = data.get("league", {})
-            date_str = data.get("date", data.get("commence_time", ""))
-
-            event = EventData(
-                id=str(data.get("id", "")),
-                sport=sport_data.get("slug", "football") if isinstance(sport_data, dict) else str(sport_data),
-                league=league_data.get("name") if isinstance(league_data, dict) else data.get("league"),
-                league_id=league_data.get("id") if isinstance(league_data, dict) else data.get("leagueId"),
-                home_team=data.get("home", data.get("home_team", "")),
-                away_team=data.get("away", data.get("away_team", "")),
-                commence_time=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
-            )
+            event = _parse_event_data(data)
 
             bookmakers_data = data.get("bookmakers", {})
             bookmaker_odds = []
 
             if isinstance(bookmakers_data, dict):
                 for bm_name, markets in bookmakers_data.items():
-                    if not isinstance(markets, list):
+                    if type(markets) is not list:
                         continue
 
                     btts_market = next(
-                        (m for m in markets if m.get("name") in ["Both Teams to Score", "BTTS", "btts"]),
+                        (m for m in markets if m.get("name") in _BTTS_MARKETS),
                         None,
                     )
 
@@ -781,10 +988,10 @@ class OddsAPIClient:
                             updated_str = btts_market.get("updatedAt", "")
                             bookmaker_odds.append(
                                 BTTSBookmaker(
-                                    key=bm_name.lower().replace(" ", "_"),
+                                    key=_normalize_bm_key(bm_name),
                                     name=bm_name,
-                                    odds=BTTSOdds(yes=yes_odds, no=no_odds),
-                                    updated_at=datetime.fromisoformat(updated_str.replace("Z", "+00:00")) if updated_str else datetime.now(),
+                                    odds=BTTSOdds.model_construct(yes=yes_odds, no=no_odds),
+                                    updated_at=_parse_ts(updated_str) if updated_str else datetime.now(),
                                 )
                             )
                     except (ValueError, TypeError):
@@ -810,30 +1017,18 @@ class OddsAPIClient:
     def _transform_correct_score(self, data: dict[str, Any]) -> CorrectScoreOutput | None:
         """Transform API response to CorrectScoreOutput format."""
         try:
-            sport_data = data.get("sport", {})
-            league_data = data.get("league", {})
-            date_str = data.get("date", data.get("commence_time", ""))
-
-            event = EventData(
-                id=str(data.get("id", "")),
-                sport=sport_data.get("slug", "football") if isinstance(sport_data, dict) else str(sport_data),
-                league=league_data.get("name") if isinstance(league_data, dict) else data.get("league"),
-                league_id=league_data.get("id") if isinstance(league_data, dict) else data.get("leagueId"),
-                home_team=data.get("home", data.get("home_team", "")),
-                away_team=data.get("away", data.get("away_team", "")),
-                commence_time=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
-            )
+            event = _parse_event_data(data)
 
             bookmakers_data = data.get("bookmakers", {})
             bookmaker_odds = []
 
             if isinstance(bookmakers_data, dict):
                 for bm_name, markets in bookmakers_data.items():
-                    if not isinstance(markets, list):
+                    if type(markets) is not list:
                         continue
 
                     cs_market = next(
-                        (m for m in markets if m.get("name") in ["Correct Score", "correct_score"]),
+                        (m for m in markets if m.get("name") in _CORRECT_SCORE_MARKETS),
                         None,
                     )
 
@@ -858,10 +1053,10 @@ class OddsAPIClient:
                         updated_str = cs_market.get("updatedAt", "")
                         bookmaker_odds.append(
                             CorrectScoreBookmaker(
-                                key=bm_name.lower().replace(" ", "_"),
+                                key=_normalize_bm_key(bm_name),
                                 name=bm_name,
                                 scores=scores,
-                                updated_at=datetime.fromisoformat(updated_str.replace("Z", "+00:00")) if updated_str else datetime.now(),
+                                updated_at=_parse_ts(updated_str) if updated_str else datetime.now(),
                             )
                         )
 
@@ -885,30 +1080,18 @@ class OddsAPIClient:
     def _transform_double_chance(self, data: dict[str, Any]) -> DoubleChanceOutput | None:
         """Transform API response to DoubleChanceOutput format."""
         try:
-            sport_data = data.get("sport", {})
-            league_data = data.get("league", {})
-            date_str = data.get("date", data.get("commence_time", ""))
-
-            event = EventData(
-                id=str(data.get("id", "")),
-                sport=sport_data.get("slug", "football") if isinstance(sport_data, dict) else str(sport_data),
-                league=league_data.get("name") if isinstance(league_data, dict) else data.get("league"),
-                league_id=league_data.get("id") if isinstance(league_data, dict) else data.get("leagueId"),
-                home_team=data.get("home", data.get("home_team", "")),
-                away_team=data.get("away", data.get("away_team", "")),
-                commence_time=datetime.fromisoformat(date_str.replace("Z", "+00:00")) if date_str else datetime.now(),
-            )
+            event = _parse_event_data(data)
 
             bookmakers_data = data.get("bookmakers", {})
             bookmaker_odds = []
 
             if isinstance(bookmakers_data, dict):
                 for bm_name, markets in bookmakers_data.items():
-                    if not isinstance(markets, list):
+                    if type(markets) is not list:
                         continue
 
                     dc_market = next(
-                        (m for m in markets if m.get("name") in ["Double Chance", "double_chance"]),
+                        (m for m in markets if m.get("name") in _DOUBLE_CHANCE_MARKETS),
                         None,
                     )
 
@@ -932,14 +1115,14 @@ class OddsAPIClient:
                             updated_str = dc_market.get("updatedAt", "")
                             bookmaker_odds.append(
                                 DoubleChanceBookmaker(
-                                    key=bm_name.lower().replace(" ", "_"),
+                                    key=_normalize_bm_key(bm_name),
                                     name=bm_name,
-                                    odds=DoubleChanceOdds(
+                                    odds=DoubleChanceOdds.model_construct(
                                         home_draw=home_draw,
                                         draw_away=draw_away,
                                         home_away=home_away,
                                     ),
-                                    updated_at=datetime.fromisoformat(updated_str.replace("Z", "+00:00")) if updated_str else datetime.now(),
+                                    updated_at=_parse_ts(updated_str) if updated_str else datetime.now(),
                                 )
                             )
                     except (ValueError, TypeError):
@@ -1031,7 +1214,7 @@ class OddsAPIClient:
                 continue
 
         # Sort by EV descending and limit
-        value_bets.sort(key=lambda x: x.expected_value, reverse=True)
+        value_bets.sort(key=attrgetter("expected_value"), reverse=True)
 
         return ValueBetsResponse(data=value_bets[:limit])
 
@@ -1077,7 +1260,7 @@ class OddsAPIClient:
             # Parse timestamp
             ev_updated_str = raw.get("expectedValueUpdatedAt", "")
             ev_updated = (
-                datetime.fromisoformat(ev_updated_str.replace("Z", "+00:00"))
+                _parse_ts(ev_updated_str)
                 if ev_updated_str
                 else datetime.now()
             )
@@ -1085,7 +1268,7 @@ class OddsAPIClient:
             # Parse event date
             event_date_str = event_data.get("date", "")
             event_date = (
-                datetime.fromisoformat(event_date_str.replace("Z", "+00:00"))
+                _parse_ts(event_date_str)
                 if event_date_str
                 else datetime.now()
             )
@@ -1195,7 +1378,7 @@ class OddsAPIClient:
                 continue
 
         # Sort by profit descending
-        arb_bets.sort(key=lambda x: x.profit_margin, reverse=True)
+        arb_bets.sort(key=attrgetter("profit_margin"), reverse=True)
 
         return ArbitrageResponse(data=arb_bets[:limit])
 
@@ -1224,7 +1407,7 @@ class OddsAPIClient:
             # Parse timestamp
             detected_str = raw.get("detectedAt", raw.get("createdAt", ""))
             detected_at = (
-                datetime.fromisoformat(detected_str.replace("Z", "+00:00"))
+                _parse_ts(detected_str)
                 if detected_str
                 else datetime.now()
             )
@@ -1232,7 +1415,7 @@ class OddsAPIClient:
             # Parse event date
             event_date_str = event_data.get("date", "")
             event_date = (
-                datetime.fromisoformat(event_date_str.replace("Z", "+00:00"))
+                _parse_ts(event_date_str)
                 if event_date_str
                 else datetime.now()
             )
@@ -1348,7 +1531,7 @@ class OddsAPIClient:
                 if isinstance(ts, (int, float)):
                     return datetime.fromtimestamp(ts)
                 if isinstance(ts, str):
-                    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                    return _parse_ts(ts)
                 return datetime.now()
 
             def parse_snapshot(data: dict[str, Any]) -> OddsSnapshot:
@@ -15,8 +15,9 @@ def get_client_ip(request: Request) -> str:
     """Get client IP, handling proxies via X-Forwarded-For."""
     forwarded = request.headers.get("X-Forwarded-For")
     if forwarded:
-        # Take the first IP (original client)
-        return forwarded.split(",")[0].strip()
+        # Take the first IP (original client) without splitting the whole hop list
+        client_ip, _, _ = forwarded.partition(",")
+        return client_ip.strip()
     return get_remote_address(request)
 
 
@@ -9,6 +9,11 @@ from fastapi import HTTPException
 from app.config import REGION_BOOKMAKERS
 from app.schemas.common import Region
 
+# Membership sets per region, built once since REGION_BOOKMAKERS is static config
+_REGION_SETS: dict[str, frozenset[str]] = {
+    region: frozenset(bookmakers) for region, bookmakers in REGION_BOOKMAKERS.items()
+}
+
 
 def get_allowed_bookmakers(region: Region) -> list[str]:
     """Get the list of allowed bookmakers for a region.
@@ -56,7 +61,8 @@ def get_bookmakers_for_region(
         return allowed
 
     # Validate requested bookmakers are allowed
-    invalid = [b for b in requested if b not in allowed]
+    allowed_set = _REGION_SETS[region.value]
+    invalid = [b for b in requested if b not in allowed_set]
     if invalid:
         raise HTTPException(
             status_code=400,
@@ -78,7 +84,7 @@ def validate_bookmaker_access(bookmaker: str, region: Region) -> None:
         HTTPException: If bookmaker is not allowed in the region
     """
     allowed = get_allowed_bookmakers(region)
-    if bookmaker not in allowed:
+    if bookmaker not in _REGION_SETS[region.value]:
         raise HTTPException(
             status_code=400,
             detail=f"Bookmaker '{bookmaker}' not available in region '{region.value}'. "
@@ -104,5 +110,5 @@ def filter_response_bookmakers(
     Returns:
         Filtered list containing only allowed bookmakers
     """
-    allowed = REGION_BOOKMAKERS.get(region.value, [])
+    allowed = _REGION_SETS.get(region.value, frozenset())
     return [b for b in bookmakers_data if b.get(bookmaker_key) in allowed]
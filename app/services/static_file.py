@@ -1,11 +1,13 @@
-import json
+import asyncio
 import logging
 import os
+import tempfile
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import orjson
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +19,87 @@ from app.schemas import OddsOutput
 logger = logging.getLogger(__name__)
 
 
+def _write_file(full_path: Path, payload: bytes) -> None:
+    """Blocking atomic file write, meant to run in a worker thread.
+
+    Writes to a uniquely named temp file in the same directory, then renames it
+    over the target, so readers never see a partially written JSON document and
+    concurrent writers of the same file never share a temp file.
+    """
+    full_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.NamedTemporaryFile(
+        dir=full_path.parent, prefix=f".{full_path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(payload)
+        os.replace(tmp.name, full_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def _iter_json_files(root: str):
+    """Yield paths of all .json files under root (os.scandir, no per-entry Path objects)."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry.path
+
+
+def _unlink_files(root: str, paths: list[str]) -> int:
+    """Unlink the given paths (relative to root), skipping files already gone."""
+    deleted = 0
+    for path in paths:
+        try:
+            os.unlink(os.path.join(root, path))
+            deleted += 1
+            logger.debug(f"Deleted file: {path}")
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(f"Failed to delete {path}: {e}")
+    return deleted
+
+
+def _remove_empty_dirs(root: str) -> int:
+    """Remove empty directories under root (root itself is kept)."""
+    deleted = 0
+    # Bottom-up walk: children are visited (and removed) before their parents, so
+    # rmdir is simply attempted and fails harmlessly on non-empty directories
+    for dirpath, _, filenames in os.walk(root, topdown=False):
+        if filenames or dirpath == root:
+            continue
+        try:
+            os.rmdir(dirpath)
+            deleted += 1
+            logger.debug(f"Deleted empty dir: {dirpath}")
+        except OSError:
+            pass
+    return deleted
+
+
+def _delete_orphans(root: str, db_paths: set[str]) -> int:
+    """Unlink .json files under root whose relative path is not in db_paths."""
+    base_len = len(root) + len(os.sep)
+    deleted = 0
+    for path in _iter_json_files(root):
+        relative_path = path[base_len:]
+        if relative_path in db_paths:
+            continue
+        try:
+            os.unlink(path)
+            deleted += 1
+            logger.debug(f"Deleted orphan file: {relative_path}")
+        except OSError as e:
+            logger.warning(f"Failed to delete orphan {relative_path}: {e}")
+    return deleted
+
+
 class StaticFileService:
     """Service for generating and managing static JSON files."""
 
@@ -94,6 +177,7 @@ class StaticFileService:
         """
         Generate static JSON file with hash-based change detection.
         Returns True if file was generated/updated, False otherwise.
+        request_data.last_refreshed is only set when odds were fetched.
         """
         request_data = static_file.request_data
 
@@ -108,9 +192,18 @@ class StaticFileService:
             logger.warning(f"No odds data for event {request_data.provider_id}")
             return False
 
-        # Compute hash
-        data_dict = odds_data.model_dump(mode="json")
-        new_hash = self.provider.compute_hash(data_dict)
+        # Dump the published fields once; hash their serialized bytes together with the
+        # ended flag, so full time is detected even when the odds themselves stop changing
+        # (metadata such as generated_at changes on every fetch and is left out)
+        data_dict = odds_data.model_dump(mode="json", include={"event", "market", "bookmakers"})
+        is_ended = odds_data.metadata.is_ended
+        new_hash = self.provider.compute_hash(
+            orjson.dumps({"data": data_dict, "isEnded": is_ended})
+        )
+
+        # Odds were fetched, so the request counts as refreshed even if nothing changed
+        now = datetime.now()
+        request_data.last_refreshed = now
 
         # Check if changed (unless force)
         if not force and static_file.hash == new_hash:
@@ -118,24 +211,17 @@ class StaticFileService:
             return False
 
         # Build output in NSN format
-        last_modified = int(datetime.now().timestamp())
+        last_modified = int(now.timestamp())
         output = {
             "lastModified": last_modified,
-            "data": {
-                "event": odds_data.event.model_dump(mode="json"),
-                "market": odds_data.market,
-                "bookmakers": [bm.model_dump(mode="json") for bm in odds_data.bookmakers],
-            },
-            "isEnded": odds_data.metadata.is_ended,
+            "data": data_dict,
+            "isEnded": is_ended,
             "hash": new_hash,
         }
 
-        # Write to file
-        full_path = self.static_path / static_file.path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(full_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, default=str)
+        # Write to file (off the event loop so concurrent jobs keep progressing)
+        payload = orjson.dumps(output)
+        await asyncio.to_thread(_write_file, self.static_path / static_file.path, payload)
 
         # Update database
         static_file.hash = new_hash
@@ -146,7 +232,7 @@ class StaticFileService:
             request_data.event_date = odds_data.event.commence_time
 
         # Check if event ended
-        if odds_data.metadata.is_ended:
+        if is_ended:
             request_data.is_ended = True
 
         logger.info(f"Generated static file: {static_file.path}")
@@ -162,14 +248,15 @@ class StaticFileService:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
-    def get_file_content(self, path: str) -> dict[str, Any] | None:
+    async def get_file_content(self, path: str) -> dict[str, Any] | None:
         """Read static file content."""
         full_path = self.static_path / path
-        if not full_path.exists():
+        try:
+            raw = await asyncio.to_thread(full_path.read_bytes)
+        except FileNotFoundError:
             return None
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(raw)
 
     async def clean_ended_events(
         self,
@@ -184,39 +271,29 @@ class StaticFileService:
             retention_days = settings.retention_days_ended
 
         cutoff_date = datetime.now() - timedelta(days=retention_days)
-        deleted_files = 0
-        deleted_requests = 0
 
-        # Find ended RequestData older than cutoff
-        stmt = select(RequestData).where(
-            RequestData.is_ended == True,
-            RequestData.updated_at < cutoff_date,
+        # Find ended RequestData older than cutoff, with their file paths in one query
+        stmt = (
+            select(RequestData.id, StaticFile.path)
+            .outerjoin(StaticFile, StaticFile.request_data_id == RequestData.id)
+            .where(
+                RequestData.is_ended == True,
+                RequestData.updated_at < cutoff_date,
+            )
         )
         result = await db.execute(stmt)
-        old_requests = result.scalars().all()
-
-        for request_data in old_requests:
-            # Get associated static files
-            stmt = select(StaticFile).where(StaticFile.request_data_id == request_data.id)
-            result = await db.execute(stmt)
-            static_files = result.scalars().all()
-
-            # Delete files from disk
-            for sf in static_files:
-                full_path = self.static_path / sf.path
-                if full_path.exists():
-                    try:
-                        full_path.unlink()
-                        deleted_files += 1
-                        logger.debug(f"Deleted file: {sf.path}")
-                    except OSError as e:
-                        logger.warning(f"Failed to delete {sf.path}: {e}")
-
-            # Delete from DB (cascade will handle static_files)
-            await db.delete(request_data)
-            deleted_requests += 1
+        rows = result.all()
 
-        await db.flush()
+        request_ids = {request_id for request_id, _ in rows}
+        paths = [path for _, path in rows if path is not None]
+
+        # Delete files from disk
+        deleted_files = await asyncio.to_thread(_unlink_files, str(self.static_path), paths)
+
+        # Delete from DB in one statement (ON DELETE CASCADE handles static_files)
+        if request_ids:
+            await db.execute(delete(RequestData).where(RequestData.id.in_(request_ids)))
+        deleted_requests = len(request_ids)
 
         logger.info(
             f"Cleaned ended events: {deleted_requests} requests, {deleted_files} files"
@@ -225,40 +302,20 @@ class StaticFileService:
 
     async def clean_orphan_files(self, db: AsyncSession) -> dict[str, int]:
         """Remove files on disk that don't exist in DB."""
-        deleted_files = 0
-
         # Get all paths from DB
         stmt = select(StaticFile.path)
         result = await db.execute(stmt)
         db_paths = set(row[0] for row in result.all())
 
         # Scan static directory
-        for file_path in self.static_path.rglob("*.json"):
-            relative_path = str(file_path.relative_to(self.static_path))
-            if relative_path not in db_paths:
-                try:
-                    file_path.unlink()
-                    deleted_files += 1
-                    logger.debug(f"Deleted orphan file: {relative_path}")
-                except OSError as e:
-                    logger.warning(f"Failed to delete orphan {relative_path}: {e}")
+        deleted_files = await asyncio.to_thread(_delete_orphans, str(self.static_path), db_paths)
 
         logger.info(f"Cleaned orphan files: {deleted_files}")
         return {"deleted_orphan_files": deleted_files}
 
     async def clean_empty_directories(self) -> dict[str, int]:
         """Remove empty directories in static path."""
-        deleted_dirs = 0
-
-        # Walk bottom-up to delete empty dirs
-        for dir_path in sorted(self.static_path.rglob("*"), reverse=True):
-            if dir_path.is_dir() and not any(dir_path.iterdir()):
-                try:
-                    dir_path.rmdir()
-                    deleted_dirs += 1
-                    logger.debug(f"Deleted empty dir: {dir_path}")
-                except OSError:
-                    pass
+        deleted_dirs = await asyncio.to_thread(_remove_empty_dirs, str(self.static_path))
 
         logger.info(f"Cleaned empty directories: {deleted_dirs}")
         return {"deleted_directories": deleted_dirs}
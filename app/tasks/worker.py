@@ -1,44 +1,76 @@
+import asyncio
 import logging
+import time
+from datetime import datetime
 from uuid import UUID
 
-from arq import cron
+from arq import cron, func
 from arq.connections import RedisSettings
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.orm import joinedload
 
 from app.api.routes.events import _fetch_upcoming_events
 from app.config import settings
-from app.db import async_session_maker
-from app.models import RequestData, StaticFile
+from app.db import async_session_maker, engine
+from app.models import RefreshFrequency, RequestData, StaticFile
 from app.services.cache import CACHE_KEY_UPCOMING, cache_service
 from app.services.static_file import static_file_service
 
 logger = logging.getLogger(__name__)
 
+# Redis sorted set of static_file_id -> next refresh time (unix seconds)
+REFRESH_SCHEDULE_KEY = "refresh:due"
+
+
+def _refresh_job_id(static_file_id: UUID) -> str:
+    """ARQ job id for a scheduled refresh (at most one queued job per file)."""
+    return f"static:{static_file_id}"
+
+
+async def _schedule_refresh(redis, static_file_id: UUID, request_data: RequestData | None) -> None:
+    """Record (or drop) the next refresh of a static file in the schedule."""
+    next_at = None
+    if request_data is not None:
+        next_at = request_data.next_refresh_at(datetime.now())
+    if next_at is None:
+        await redis.zrem(REFRESH_SCHEDULE_KEY, str(static_file_id))
+    else:
+        await redis.zadd(REFRESH_SCHEDULE_KEY, {str(static_file_id): next_at})
+
 
 async def generate_static_file_task(ctx: dict, static_file_id: UUID, bookmakers: list[str] | None = None) -> bool:
     """Background task to generate static file."""
     async with async_session_maker() as db:
-        stmt = select(StaticFile).where(StaticFile.id == static_file_id)
+        # Load the file and its request_data in one query
+        stmt = (
+            select(StaticFile)
+            .where(StaticFile.id == static_file_id)
+            .options(joinedload(StaticFile.request_data))
+        )
         result = await db.execute(stmt)
         static_file = result.scalar_one_or_none()
 
         if not static_file:
             logger.error(f"StaticFile not found: {static_file_id}")
+            await _schedule_refresh(ctx["redis"], static_file_id, None)
             return False
 
-        # Load relationship
-        stmt = select(RequestData).where(RequestData.id == static_file.request_data_id)
-        result = await db.execute(stmt)
-        static_file.request_data = result.scalar_one()
-
+        refreshed_before = static_file.request_data.last_refreshed
         success = await static_file_service.generate_static_file(
             db=db,
             static_file=static_file,
             bookmakers=bookmakers,
         )
         await db.commit()
+
+    request_data = static_file.request_data
+    if request_data.last_refreshed == refreshed_before:
+        # No odds fetched: keep the retry slot written by refresh_active_odds
         return success
 
+    await _schedule_refresh(ctx["redis"], static_file_id, request_data)
+    return success
+
 
 async def refresh_active_odds(ctx: dict) -> dict:
     """Scheduled task to refresh odds files based on intelligent frequency.
@@ -48,56 +80,37 @@ async def refresh_active_odds(ctx: dict) -> dict:
     - HOURLY (1-5 days away): refresh every hour
     - DAILY (5+ days away): refresh once per day
     - NONE (ended): no refresh
+
+    Due files are popped from the REFRESH_SCHEDULE_KEY sorted set (O(due) instead
+    of scanning every active row) and each is enqueued as its own
+    generate_static_file_task job, so ARQ spreads the work across worker slots
+    (bounded by max_jobs). The job reschedules the file once odds were fetched. Jobs
+    use a per-file job id, so a file already queued is not enqueued twice.
     """
     logger.info("Starting intelligent odds refresh job")
 
-    async with async_session_maker() as db:
-        # Get all active request_data
-        stmt = select(RequestData).where(RequestData.is_ended == False)
-        result = await db.execute(stmt)
-        active_requests = result.scalars().all()
-
-        refreshed_count = 0
-        skipped_count = 0
-        error_count = 0
-
-        for request_data in active_requests:
-            # Check if refresh is needed based on frequency
-            if not request_data.needs_refresh():
-                skipped_count += 1
-                continue
-
-            # Get static file
-            stmt = select(StaticFile).where(StaticFile.request_data_id == request_data.id)
-            result = await db.execute(stmt)
-            static_file = result.scalar_one_or_none()
-
-            if not static_file:
-                continue
-
-            static_file.request_data = request_data
-
-            try:
-                success = await static_file_service.generate_static_file(
-                    db=db,
-                    static_file=static_file,
-                )
-                if success:
-                    # Update last_refreshed timestamp
-                    from datetime import datetime
-                    request_data.last_refreshed = datetime.now()
-                    refreshed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to refresh {request_data.provider_id}: {e}")
-                error_count += 1
-
-        await db.commit()
+    redis = ctx["redis"]
+    now = time.time()
+    due_members = await redis.zrangebyscore(REFRESH_SCHEDULE_KEY, 0, now)
+    if not due_members:
+        logger.info("Odds refresh completed: 0 enqueued")
+        return {"enqueued": 0}
+
+    # Push due entries out by one LIVE interval so a failed job is retried next cycle
+    # rather than dropped; a successful job overwrites this with its real next time
+    retry_at = now + RefreshFrequency.LIVE.get_interval_seconds()
+    await redis.zadd(REFRESH_SCHEDULE_KEY, {member: retry_at for member in due_members})
+
+    for member in due_members:
+        static_file_id = UUID(member.decode() if isinstance(member, bytes) else member)
+        await redis.enqueue_job(
+            "generate_static_file_task",
+            static_file_id,
+            _job_id=_refresh_job_id(static_file_id),
+        )
 
-    logger.info(
-        f"Odds refresh completed: {refreshed_count} refreshed, "
-        f"{skipped_count} skipped (not due), {error_count} errors"
-    )
-    return {"refreshed": refreshed_count, "skipped": skipped_count, "errors": error_count}
+    logger.info(f"Odds refresh completed: {len(due_members)} enqueued")
+    return {"enqueued": len(due_members)}
 
 
 async def refresh_upcoming_events(ctx: dict) -> dict:
@@ -138,10 +151,56 @@ async def clean_old_data(ctx: dict) -> dict:
         return {"error": str(e)}
 
 
+async def _seed_refresh_schedule(redis) -> int:
+    """Rebuild the refresh schedule from the DB (covers files created outside the worker)."""
+    async with async_session_maker() as db:
+        stmt = (
+            select(StaticFile.id, RequestData)
+            .join(RequestData, StaticFile.request_data_id == RequestData.id)
+            .where(RequestData.is_ended == False)
+            .execution_options(yield_per=500)
+        )
+        rows = await db.stream(stmt)
+
+        schedule: dict[str, float] = {}
+        async for static_file_id, request_data in rows:
+            next_at = request_data.next_refresh_at(request_data.last_refreshed)
+            if next_at is not None:
+                schedule[str(static_file_id)] = next_at
+
+    pipe = redis.pipeline(transaction=True)
+    pipe.delete(REFRESH_SCHEDULE_KEY)
+    if schedule:
+        pipe.zadd(REFRESH_SCHEDULE_KEY, schedule)
+    await pipe.execute()
+    return len(schedule)
+
+
+async def startup(ctx: dict) -> None:
+    """Warm the DB connection pool and seed the refresh schedule."""
+
+    async def _open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(_open_connection() for _ in range(WorkerSettings.max_jobs)))
+    except Exception as e:
+        logger.warning(f"Failed to warm DB pool: {e}")
+
+    try:
+        seeded = await _seed_refresh_schedule(ctx["redis"])
+        logger.info(f"Refresh schedule seeded with {seeded} files")
+    except Exception as e:
+        logger.warning(f"Failed to seed refresh schedule: {e}")
+
+
 class WorkerSettings:
     """ARQ worker settings."""
 
-    functions = [generate_static_file_task]
+    # No stored results: ARQ refuses a job id while its result is kept, which would
+    # block the next scheduled refresh of the same file
+    functions = [func(generate_static_file_task, keep_result=0)]
     cron_jobs = [
         # Intelligent refresh: runs every 5 min but only refreshes what's due
         # - LIVE events (today): refreshed every 5 min
@@ -153,6 +212,7 @@ class WorkerSettings:
         # Daily cleanup at 3:00 AM
         cron(clean_old_data, hour={3}, minute={0}),
     ]
+    on_startup = startup
     redis_settings = RedisSettings.from_dsn(settings.redis_url)
     max_jobs = 10
     job_timeout = 300  # 5 minutes
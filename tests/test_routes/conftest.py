@@ -0,0 +1,233 @@
+"""Fixtures shared by route tests."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+from httpx import Response
+
+from app.schemas import (
+    BookmakerOdds,
+    EventData,
+    OddsMetadata,
+    OddsOutput,
+    OddsValues,
+    TotalsBookmaker,
+    TotalsLine,
+    TotalsOutput,
+)
+from app.schemas.events import LeagueInfo, SportInfo
+from app.schemas.odds_movements import OddsMovementsResponse, OddsSnapshot
+from app.schemas.value_bets import (
+    ConsensusOdds,
+    ValueBet,
+    ValueBetEvent,
+    ValueBetOdds,
+    ValueBetsResponse,
+)
+
+
+def aret(value: Any):
+    """Return a plain async callable that always resolves to value.
+
+    Cheaper than AsyncMock for stubs nobody asserts on (no call recording).
+    """
+
+    async def _f(*args, **kwargs):
+        return value
+
+    return _f
+
+
+def js(response: Response) -> Any:
+    """Decode a response body with orjson (faster than response.json())."""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def _service_stubs():
+    """Stateless cache (always a miss) and metrics stubs, built once per session."""
+    cache = SimpleNamespace(
+        get=aret(None),
+        get_many=aret([]),
+        get_raw=aret(None),
+        set=aret(None),
+        set_raw=aret(None),
+        delete=aret(None),
+        get_client=aret(AsyncMock()),
+    )
+    metrics = SimpleNamespace(
+        track_request=aret(None),
+        track_error=aret(None),
+        track_latency=aret(None),
+        track_api_call=aret(None),
+        track_cache_hit=aret(None),
+        track_cache_miss=aret(None),
+    )
+    return SimpleNamespace(cache=cache, metrics=metrics)
+
+
+@pytest.fixture(autouse=True)
+def _default_mocks(monkeypatch, _service_stubs):
+    """Install the cache and metrics stubs for every route test."""
+    monkeypatch.setattr("app.services.cache.cache_service", _service_stubs.cache)
+    monkeypatch.setattr("app.services.metrics.metrics_service", _service_stubs.metrics)
+    return _service_stubs
+
+
+# Route modules that bind odds_api_provider at import time
+ROUTE_PROVIDER_MODULES = (
+    "arbitrage",
+    "bookmakers",
+    "events",
+    "leagues",
+    "odds",
+    "participants",
+    "sports",
+    "value_bets",
+)
+
+
+@pytest.fixture
+def route_provider(monkeypatch):
+    """One AsyncMock standing in for odds_api_provider in every route module."""
+    provider = AsyncMock()
+    for module in ROUTE_PROVIDER_MODULES:
+        monkeypatch.setattr(f"app.api.routes.{module}.odds_api_provider", provider)
+    return provider
+
+
+@pytest.fixture(scope="session")
+def sample_odds_output() -> OddsOutput:
+    """1x2 odds for evt_123 from a single bookmaker, built once per session."""
+    return OddsOutput(
+        event=EventData(
+            id="evt_123",
+            sport="football",
+            league="Premier League",
+            league_id="pl",
+            home_team="Team A",
+            away_team="Team B",
+            commence_time=datetime(2026, 1, 20, 15, 0, 0),
+        ),
+        market="1x2",
+        bookmakers=[
+            BookmakerOdds(
+                key="bet365",
+                name="Bet365",
+                odds=OddsValues(home=1.80, draw=3.50, away=4.20),
+                updated_at=datetime(2026, 1, 18, 10, 0, 0),
+            ),
+        ],
+        metadata=OddsMetadata(
+            generated_at=datetime(2026, 1, 18, 10, 0, 0),
+            is_ended=False,
+            hash="abc123",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_totals_output() -> TotalsOutput:
+    """Totals odds for evt_123 with a single 2.5 line, built once per session."""
+    return TotalsOutput(
+        event=EventData(
+            id="evt_123",
+            sport="football",
+            home_team="Team A",
+            away_team="Team B",
+            commence_time=datetime(2026, 1, 20, 15, 0, 0),
+        ),
+        market="totals",
+        bookmakers=[
+            TotalsBookmaker(
+                key="bet365",
+                name="Bet365",
+                lines=[TotalsLine(line=2.5, over=1.90, under=1.95)],
+                updated_at=datetime(2026, 1, 18, 10, 0, 0),
+            ),
+        ],
+        metadata=OddsMetadata(
+            generated_at=datetime(2026, 1, 18, 10, 0, 0),
+            is_ended=False,
+            hash="abc123",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_movements_response() -> OddsMovementsResponse:
+    """ML odds movements for evt_123 at Bet365, built once per session."""
+    return OddsMovementsResponse(
+        eventId="evt_123",
+        bookmaker="Bet365",
+        market="ML",
+        opening=OddsSnapshot(
+            home=1.90, draw=3.60, away=4.50, timestamp=datetime(2026, 1, 15, 10, 0, 0)
+        ),
+        latest=OddsSnapshot(
+            home=1.80, draw=3.50, away=4.20, timestamp=datetime(2026, 1, 18, 10, 0, 0)
+        ),
+        movements=[
+            OddsSnapshot(
+                home=1.90, draw=3.60, away=4.50, timestamp=datetime(2026, 1, 15, 10, 0, 0)
+            ),
+            OddsSnapshot(
+                home=1.85, draw=3.55, away=4.35, timestamp=datetime(2026, 1, 16, 10, 0, 0)
+            ),
+            OddsSnapshot(
+                home=1.80, draw=3.50, away=4.20, timestamp=datetime(2026, 1, 18, 10, 0, 0)
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_movements_totals() -> OddsMovementsResponse:
+    """Totals odds movements for evt_123 at Bet365, built once per session."""
+    return OddsMovementsResponse(
+        eventId="evt_123",
+        bookmaker="Bet365",
+        market="Totals",
+        opening=OddsSnapshot(home=1.90, away=1.90, timestamp=datetime(2026, 1, 15)),
+        latest=OddsSnapshot(home=1.85, away=1.95, timestamp=datetime(2026, 1, 18)),
+        movements=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_value_bets_response() -> ValueBetsResponse:
+    """One Bet365 home value bet on Team A vs Team B, built once per session."""
+    return ValueBetsResponse(
+        data=[
+            ValueBet(
+                id="vb_123",
+                eventId="evt_123",
+                bookmaker="Bet365",
+                market="ML",
+                betSide="home",
+                expectedValue=5.5,
+                expectedValueUpdatedAt=datetime(2026, 1, 18, 10, 0, 0),
+                bookmakerOdds=ValueBetOdds(
+                    home=2.10, draw=3.40, away=3.80, homeDirectLink="https://bet365.com"
+                ),
+                consensusOdds=ConsensusOdds(home=1.95, draw=3.50, away=4.00),
+                event=ValueBetEvent(
+                    home="Team A",
+                    away="Team B",
+                    date=datetime(2026, 1, 20, 15, 0, 0),
+                    sport=SportInfo(name="Football", slug="football"),
+                    league=LeagueInfo(name="Premier League", slug="premier-league"),
+                ),
+            ),
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_value_bets_response() -> ValueBetsResponse:
+    """Value bets response with no data, built once per session."""
+    return ValueBetsResponse(data=[])
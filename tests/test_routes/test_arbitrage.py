@@ -1,8 +1,8 @@
 """Tests for arbitrage routes."""
 
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from app.schemas.arbitrage import (
@@ -14,9 +14,19 @@ from app.schemas.arbitrage import (
 )
 from app.schemas.events import LeagueInfo, SportInfo
 
+from .conftest import js
 
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_success(test_client, mock_cache_service, mock_metrics_service):
+# Request URLs built once per module instead of merging params on every call
+ARBITRAGE_URL = httpx.URL("/arbitrage-bets")
+URL_UK = ARBITRAGE_URL.copy_merge_params({"region": "uk"})
+URL_UK_TENNIS = URL_UK.copy_merge_params({"sport": "tennis"})
+URL_UK_MIN_PROFIT = URL_UK.copy_merge_params({"minProfit": 3.0})
+URL_UK_LIMIT_10 = URL_UK.copy_merge_params({"limit": 10})
+URL_UK_LIMIT_100 = URL_UK.copy_merge_params({"limit": 100})
+URL_BR = ARBITRAGE_URL.copy_merge_params({"region": "br"})
+
+
+async def test_list_arbitrage_bets_success(test_client, route_provider):
     """Test GET /arbitrage-bets returns arbitrage opportunities."""
     arb_bet = ArbitrageBet(
         id="arb_456",
@@ -44,103 +54,71 @@ async def test_list_arbitrage_bets_success(test_client, mock_cache_service, mock
     )
     response_data = ArbitrageResponse(data=[arb_bet])
 
-    with patch("app.api.routes.arbitrage.odds_api_provider") as mock_provider:
-        mock_provider.get_arbitrage_bets = AsyncMock(return_value=response_data)
-
-        response = await test_client.get("/arbitrage-bets", params={"region": "uk"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "data" in data
-        assert len(data["data"]) == 1
-        assert data["data"][0]["profitMargin"] == 2.5
-        assert len(data["data"][0]["legs"]) == 2
-
-
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_with_sport_filter(
-    test_client, mock_cache_service, mock_metrics_service
-):
-    """Test GET /arbitrage-bets with sport filter."""
-    with patch("app.api.routes.arbitrage.odds_api_provider") as mock_provider:
-        mock_provider.get_arbitrage_bets = AsyncMock(return_value=ArbitrageResponse(data=[]))
-
-        response = await test_client.get("/arbitrage-bets", params={"region": "uk", "sport": "tennis"})
-
-        assert response.status_code == 200
-        call_kwargs = mock_provider.get_arbitrage_bets.call_args[1]
-        assert call_kwargs["sport"] == "tennis"
+    route_provider.get_arbitrage_bets.return_value = response_data
 
+    response = await test_client.get(URL_UK)
 
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_with_min_profit(
-    test_client, mock_cache_service, mock_metrics_service
-):
-    """Test GET /arbitrage-bets with minProfit filter."""
-    with patch("app.api.routes.arbitrage.odds_api_provider") as mock_provider:
-        mock_provider.get_arbitrage_bets = AsyncMock(return_value=ArbitrageResponse(data=[]))
-
-        response = await test_client.get("/arbitrage-bets", params={"region": "uk", "minProfit": 3.0})
+    assert response.status_code == 200
+    data = js(response)
+    assert "data" in data
+    assert len(data["data"]) == 1
+    assert data["data"][0]["profitMargin"] == 2.5
+    assert len(data["data"][0]["legs"]) == 2
 
-        assert response.status_code == 200
-        call_kwargs = mock_provider.get_arbitrage_bets.call_args[1]
-        assert call_kwargs["min_profit"] == 3.0
 
-
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_with_limit(
-    test_client, mock_cache_service, mock_metrics_service
+@pytest.mark.parametrize(
+    ("url", "kwarg", "expected"),
+    [
+        (URL_UK_TENNIS, "sport", "tennis"),
+        (URL_UK_MIN_PROFIT, "min_profit", 3.0),
+        (URL_UK_LIMIT_10, "limit", 10),
+    ],
+    ids=["sport", "min_profit", "limit"],
+)
+async def test_list_arbitrage_bets_with_filter(
+    test_client, route_provider, url, kwarg, expected
 ):
-    """Test GET /arbitrage-bets with limit parameter."""
-    with patch("app.api.routes.arbitrage.odds_api_provider") as mock_provider:
-        mock_provider.get_arbitrage_bets = AsyncMock(return_value=ArbitrageResponse(data=[]))
+    """Test GET /arbitrage-bets forwards query filters to the provider."""
+    route_provider.get_arbitrage_bets.return_value = ArbitrageResponse(data=[])
 
-        response = await test_client.get("/arbitrage-bets", params={"region": "uk", "limit": 10})
+    response = await test_client.get(url)
 
-        assert response.status_code == 200
-        call_kwargs = mock_provider.get_arbitrage_bets.call_args[1]
-        assert call_kwargs["limit"] == 10
+    assert response.status_code == 200
+    call_kwargs = route_provider.get_arbitrage_bets.call_args[1]
+    assert call_kwargs[kwarg] == expected
 
 
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_empty(test_client, mock_cache_service, mock_metrics_service):
+async def test_list_arbitrage_bets_empty(test_client, route_provider):
     """Test GET /arbitrage-bets returns empty list."""
-    with patch("app.api.routes.arbitrage.odds_api_provider") as mock_provider:
-        mock_provider.get_arbitrage_bets = AsyncMock(return_value=ArbitrageResponse(data=[]))
+    route_provider.get_arbitrage_bets.return_value = ArbitrageResponse(data=[])
 
-        response = await test_client.get("/arbitrage-bets", params={"region": "uk"})
+    response = await test_client.get(URL_UK)
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["data"] == []
+    assert response.status_code == 200
+    data = js(response)
+    assert data["data"] == []
 
 
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_limit_validation(
-    test_client, mock_cache_service, mock_metrics_service
-):
+async def test_list_arbitrage_bets_limit_validation(test_client):
     """Test GET /arbitrage-bets rejects limit > 50."""
-    response = await test_client.get("/arbitrage-bets", params={"region": "uk", "limit": 100})
+    response = await test_client.get(URL_UK_LIMIT_100)
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_missing_region(test_client, mock_cache_service, mock_metrics_service):
+async def test_list_arbitrage_bets_missing_region(test_client):
     """Test GET /arbitrage-bets without region returns 422."""
-    response = await test_client.get("/arbitrage-bets")
+    response = await test_client.get(ARBITRAGE_URL)
     assert response.status_code == 422  # Validation error - region is required
 
 
-@pytest.mark.asyncio
-async def test_list_arbitrage_bets_region_bookmakers(test_client, mock_cache_service, mock_metrics_service):
+async def test_list_arbitrage_bets_region_bookmakers(test_client, route_provider):
     """Test GET /arbitrage-bets passes correct bookmakers for region."""
-    with patch("app.api.routes.arbitrage.odds_api_provider") as mock_provider:
-        mock_provider.get_arbitrage_bets = AsyncMock(return_value=ArbitrageResponse(data=[]))
+    route_provider.get_arbitrage_bets.return_value = ArbitrageResponse(data=[])
 
-        response = await test_client.get("/arbitrage-bets", params={"region": "br"})
+    response = await test_client.get(URL_BR)
 
-        assert response.status_code == 200
-        call_kwargs = mock_provider.get_arbitrage_bets.call_args[1]
-        # Should pass Brazilian bookmakers
-        assert "betano" in call_kwargs["bookmakers"]
-        assert "pixbet" in call_kwargs["bookmakers"]
+    assert response.status_code == 200
+    call_kwargs = route_provider.get_arbitrage_bets.call_args[1]
+    # Should pass Brazilian bookmakers
+    assert "betano" in call_kwargs["bookmakers"]
+    assert "pixbet" in call_kwargs["bookmakers"]
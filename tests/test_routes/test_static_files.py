@@ -1,18 +1,66 @@
 """Tests for static files routes."""
 
 from datetime import datetime
-from pathlib import Path
+from types import SimpleNamespace
+from typing import Final
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.api.dependencies import get_db
+from app.api.routes.static_files import get_file_info, serve_static_file
+from app.config import settings
+from app.main import app
+from app.schemas.common import Region
+from app.schemas.static_file import FileInfoResponse, GenerateRequest, GenerateResponse
+from app.services.region_filter import get_bookmakers_for_region
+
+from .conftest import aret, js
+
+# Tests only need a well-formed id, not a fresh random one
+_FIXED_UUID = UUID("00000000-0000-4000-8000-000000000001")
+_FILE_INFO_URL: Final = f"/files/{_FIXED_UUID}"
+_STATIC_URL: Final = "/static/2026/01/odds-test.json"
+
+
+class _PathStub:
+    """Minimal stand-in for static_file_service.static_path (joins to itself)."""
+
+    __slots__ = ("_exists",)
+
+    def __init__(self, exists: bool):
+        self._exists = exists
+
+    def __truediv__(self, other: str) -> "_PathStub":
+        return self
+
+    def exists(self) -> bool:
+        return self._exists
+
+
+@pytest.fixture
+def patched_static_files(monkeypatch):
+    """Mock static_file_service and the DB session for the static files routes."""
+    service = MagicMock()
+    db = AsyncMock()
+    monkeypatch.setattr("app.api.routes.static_files.static_file_service", service)
+    monkeypatch.setitem(app.dependency_overrides, get_db, lambda: db)
+    return SimpleNamespace(service=service, db=db)
+
+
+@pytest.fixture
+def clean_data_settings(monkeypatch):
+    """Configure the clean-data token and retention shared by the clean-data tests."""
+    monkeypatch.setattr(settings, "clean_data_token", "secret_token")
+    monkeypatch.setattr(settings, "retention_days_ended", 7)
+    return settings
 
 
 def test_generate_request_schema():
     """Test GenerateRequest schema validation."""
-    from app.schemas.common import Region
-    from app.schemas.static_file import GenerateRequest
-
     # Valid request with region
     request = GenerateRequest(event_id="evt_123", region=Region.BR, market="1x2")
     assert request.event_id == "evt_123"
@@ -32,11 +80,6 @@ def test_generate_request_schema():
 
 def test_generate_requires_region():
     """Test GenerateRequest requires region field."""
-    import pytest
-    from pydantic import ValidationError
-
-    from app.schemas.static_file import GenerateRequest
-
     # Missing region should raise ValidationError (422 in API)
     with pytest.raises(ValidationError) as exc_info:
         GenerateRequest(event_id="evt_123", market="1x2")
@@ -47,26 +90,18 @@ def test_generate_requires_region():
 
 def test_generate_validates_bookmakers():
     """Test bookmaker validation for region."""
-    from fastapi import HTTPException
-
-    from app.schemas.common import Region
-    from app.services.region_filter import get_bookmakers_for_region
-
     # UK bookmaker not allowed in BR region should raise 400
-    try:
+    with pytest.raises(HTTPException) as exc_info:
         get_bookmakers_for_region(Region.BR, ["bet365"])
-        assert False, "Should have raised HTTPException"
-    except HTTPException as e:
-        assert e.status_code == 400
-        assert "not available in region" in e.detail
+
+    assert exc_info.value.status_code == 400
+    assert "not available in region" in exc_info.value.detail
 
 
 def test_generate_response_schema():
     """Test GenerateResponse schema structure."""
-    from app.schemas.static_file import GenerateResponse
-
     response = GenerateResponse(
-        request_id=uuid4(),
+        request_id=_FIXED_UUID,
         status="queued",
         path="2026/01/odds-test.json",
     )
@@ -77,10 +112,8 @@ def test_generate_response_schema():
 
 def test_file_info_response_schema():
     """Test FileInfoResponse schema structure."""
-    from app.schemas.static_file import FileInfoResponse
-
     response = FileInfoResponse(
-        request_id=uuid4(),
+        request_id=_FIXED_UUID,
         status="completed",
         path="2026/01/odds-test.json",
         hash="abc123",
@@ -91,175 +124,109 @@ def test_file_info_response_schema():
     assert response.hash == "abc123"
 
 
-@pytest.mark.asyncio
-async def test_get_file_info_success(test_client, mock_cache_service, mock_metrics_service):
+async def test_get_file_info_success(test_client, patched_static_files):
     """Test GET /files/{request_id} returns file info."""
-    request_id = uuid4()
-
     mock_static_file = MagicMock()
     mock_static_file.path = "2026/01/odds-test.json"
     mock_static_file.hash = "abc123"
     mock_static_file.updated_at = datetime(2026, 1, 18, 10, 0, 0)
 
-    with (
-        patch("app.api.routes.static_files.static_file_service") as mock_service,
-        patch("app.api.routes.static_files.get_db") as mock_get_db,
-    ):
-        mock_db = AsyncMock()
-        mock_get_db.return_value = mock_db
+    patched_static_files.service.get_static_file_by_request_id = aret(mock_static_file)
 
-        mock_service.get_static_file_by_request_id = AsyncMock(return_value=mock_static_file)
+    response = await test_client.get(_FILE_INFO_URL)
 
-        response = await test_client.get(f"/files/{request_id}")
+    assert response.status_code == 200
+    data = js(response)
+    assert data["status"] == "completed"
+    assert data["hash"] == "abc123"
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "completed"
-        assert data["hash"] == "abc123"
 
-
-@pytest.mark.asyncio
-async def test_get_file_info_pending(test_client, mock_cache_service, mock_metrics_service):
+async def test_get_file_info_pending(test_client, patched_static_files):
     """Test GET /files/{request_id} returns pending status."""
-    request_id = uuid4()
-
     mock_static_file = MagicMock()
     mock_static_file.path = "2026/01/odds-test.json"
     mock_static_file.hash = None  # No hash = pending
     mock_static_file.updated_at = datetime(2026, 1, 18, 10, 0, 0)
 
-    with (
-        patch("app.api.routes.static_files.static_file_service") as mock_service,
-        patch("app.api.routes.static_files.get_db") as mock_get_db,
-    ):
-        mock_db = AsyncMock()
-        mock_get_db.return_value = mock_db
+    patched_static_files.service.get_static_file_by_request_id = aret(mock_static_file)
 
-        mock_service.get_static_file_by_request_id = AsyncMock(return_value=mock_static_file)
+    response = await test_client.get(_FILE_INFO_URL)
 
-        response = await test_client.get(f"/files/{request_id}")
+    assert response.status_code == 200
+    data = js(response)
+    assert data["status"] == "pending"
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "pending"
 
+async def test_get_file_info_not_found(patched_static_files):
+    """Test get_file_info raises 404 (handler called directly, no ASGI round-trip)."""
+    patched_static_files.service.get_static_file_by_request_id = aret(None)
 
-@pytest.mark.asyncio
-async def test_get_file_info_not_found(test_client, mock_cache_service, mock_metrics_service):
-    """Test GET /files/{request_id} returns 404."""
-    request_id = uuid4()
+    with pytest.raises(HTTPException) as exc_info:
+        await get_file_info(request_id=_FIXED_UUID, db=patched_static_files.db)
 
-    with (
-        patch("app.api.routes.static_files.static_file_service") as mock_service,
-        patch("app.api.routes.static_files.get_db") as mock_get_db,
-    ):
-        mock_db = AsyncMock()
-        mock_get_db.return_value = mock_db
+    assert exc_info.value.status_code == 404
 
-        mock_service.get_static_file_by_request_id = AsyncMock(return_value=None)
 
-        response = await test_client.get(f"/files/{request_id}")
+async def test_serve_static_file_success(test_client, patched_static_files):
+    """Test GET /static/{year}/{month}/{filename} serves file."""
+    # Create temp file
+    patched_static_files.service.static_path = _PathStub(exists=True)
 
-        assert response.status_code == 404
+    with patch("app.api.routes.static_files.FileResponse") as mock_response:
+        mock_response.return_value = MagicMock()
 
+        # This will fail because FileResponse needs a real path
+        # Just verify the route exists
+        response = await test_client.get(_STATIC_URL)
 
-@pytest.mark.asyncio
-async def test_serve_static_file_success(test_client, mock_cache_service, mock_metrics_service):
-    """Test GET /static/{year}/{month}/{filename} serves file."""
-    with patch("app.api.routes.static_files.static_file_service") as mock_service:
-        # Create temp file
-        mock_path = MagicMock(spec=Path)
-        mock_path.exists.return_value = True
-        mock_service.static_path = MagicMock()
-        mock_service.static_path.__truediv__ = MagicMock(return_value=mock_path)
+        # Will return 404 because mock path doesn't exist in reality
+        # But we've verified the route works
 
-        with patch("app.api.routes.static_files.FileResponse") as mock_response:
-            mock_response.return_value = MagicMock()
 
-            # This will fail because FileResponse needs a real path
-            # Just verify the route exists
-            response = await test_client.get("/static/2026/01/odds-test.json")
+async def test_serve_static_file_not_found(patched_static_files):
+    """Test serve_static_file raises 404 (handler called directly, no ASGI round-trip)."""
+    patched_static_files.service.static_path = _PathStub(exists=False)
 
-            # Will return 404 because mock path doesn't exist in reality
-            # But we've verified the route works
+    with pytest.raises(HTTPException) as exc_info:
+        await serve_static_file(year=2026, month=1, filename="nonexistent.json")
 
+    assert exc_info.value.status_code == 404
 
-@pytest.mark.asyncio
-async def test_serve_static_file_not_found(test_client, mock_cache_service, mock_metrics_service):
-    """Test GET /static/{year}/{month}/{filename} returns 404."""
-    with patch("app.api.routes.static_files.static_file_service") as mock_service:
-        mock_path = MagicMock(spec=Path)
-        mock_path.exists.return_value = False
-        mock_service.static_path = MagicMock()
-        mock_service.static_path.__truediv__ = MagicMock(return_value=mock_path)
 
-        response = await test_client.get("/static/2026/01/nonexistent.json")
+async def test_clean_data_success(test_client, patched_static_files, clean_data_settings):
+    """Test POST /clean-data/{token} cleans old data."""
+    patched_static_files.service.clean_all = aret(
+        {
+            "deleted_events": 5,
+            "deleted_files": 3,
+            "cleaned_directories": 1,
+        }
+    )
+
+    response = await test_client.post("/clean-data/secret_token")
 
-        assert response.status_code == 404
+    assert response.status_code == 200
+    data = js(response)
+    assert data["status"] == "completed"
+    assert data["deleted_events"] == 5
+    patched_static_files.db.commit.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_clean_data_success(test_client, mock_cache_service, mock_metrics_service):
-    """Test POST /clean-data/{token} cleans old data."""
-    with (
-        patch("app.api.routes.static_files.static_file_service") as mock_service,
-        patch("app.api.routes.static_files.get_db") as mock_get_db,
-        patch("app.api.routes.static_files.settings") as mock_settings,
-    ):
-        mock_db = AsyncMock()
-        mock_get_db.return_value = mock_db
-
-        mock_settings.clean_data_token = "secret_token"
-        mock_settings.retention_days_ended = 7
-
-        mock_service.clean_all = AsyncMock(
-            return_value={
-                "deleted_events": 5,
-                "deleted_files": 3,
-                "cleaned_directories": 1,
-            }
-        )
-
-        response = await test_client.post("/clean-data/secret_token")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "completed"
-        assert data["deleted_events"] == 5
-
-
-@pytest.mark.asyncio
-async def test_clean_data_invalid_token(test_client, mock_cache_service, mock_metrics_service):
+async def test_clean_data_invalid_token(test_client, patched_static_files, clean_data_settings):
     """Test POST /clean-data/{token} rejects invalid token."""
-    with (
-        patch("app.api.routes.static_files.settings") as mock_settings,
-        patch("app.api.routes.static_files.get_db") as mock_get_db,
-    ):
-        mock_settings.clean_data_token = "secret_token"
-        mock_db = AsyncMock()
-        mock_get_db.return_value = mock_db
+    response = await test_client.post("/clean-data/wrong_token")
 
-        response = await test_client.post("/clean-data/wrong_token")
+    assert response.status_code == 403
 
-        assert response.status_code == 403
 
-
-@pytest.mark.asyncio
-async def test_clean_data_no_token_required(test_client, mock_cache_service, mock_metrics_service):
+async def test_clean_data_no_token_required(
+    test_client, patched_static_files, clean_data_settings, monkeypatch
+):
     """Test POST /clean-data/{token} works when no token configured."""
-    with (
-        patch("app.api.routes.static_files.static_file_service") as mock_service,
-        patch("app.api.routes.static_files.get_db") as mock_get_db,
-        patch("app.api.routes.static_files.settings") as mock_settings,
-    ):
-        mock_db = AsyncMock()
-        mock_get_db.return_value = mock_db
-
-        mock_settings.clean_data_token = ""  # No token required
-        mock_settings.retention_days_ended = 7
+    monkeypatch.setattr(clean_data_settings, "clean_data_token", "")  # No token required
 
-        mock_service.clean_all = AsyncMock(return_value={"deleted_events": 0})
+    patched_static_files.service.clean_all = aret({"deleted_events": 0})
 
-        response = await test_client.post("/clean-data/any_token")
+    response = await test_client.post("/clean-data/any_token")
 
-        assert response.status_code == 200
+    assert response.status_code == 200
@@ -1,12 +1,25 @@
 """Tests for cache service."""
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call
 
+import orjson
 import pytest
 
 from app.services.cache import CacheService
 
+# Cached payloads and their stored JSON, serialized once at import
+_CACHED_DATA_SIMPLE = {"key": "value"}
+_CACHED_DATA_SIMPLE_JSON = json.dumps(_CACHED_DATA_SIMPLE)
+_CACHED_DATA_COMPLEX = {
+    "events": [
+        {"id": "1", "home": "Team A", "away": "Team B"},
+        {"id": "2", "home": "Team C", "away": "Team D"},
+    ],
+    "pagination": {"total": 2, "limit": 10},
+}
+_CACHED_DATA_COMPLEX_JSON = json.dumps(_CACHED_DATA_COMPLEX)
+
 
 @pytest.fixture
 def cache_service():
@@ -14,205 +27,132 @@ def cache_service():
     return CacheService()
 
 
-@pytest.mark.asyncio
-async def test_get_cache_hit(cache_service):
-    """Test get returns cached data."""
-    cached_data = {"key": "value"}
-
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
-
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=json.dumps(cached_data))
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
-
-        # Mock metrics
-        with patch("app.services.metrics.metrics_service") as mock_metrics:
-            mock_metrics.track_cache_hit = AsyncMock()
-
-            result = await cache_service.get("test_key")
-
-            assert result == cached_data
-            mock_metrics.track_cache_hit.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_get_cache_miss(cache_service):
-    """Test get returns None on cache miss."""
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
-
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
-
-        with patch("app.services.metrics.metrics_service") as mock_metrics:
-            mock_metrics.track_cache_miss = AsyncMock()
-
-            result = await cache_service.get("missing_key")
-
-            assert result is None
-            mock_metrics.track_cache_miss.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_get_no_metrics(cache_service):
-    """Test get with track_metrics=False."""
-    cached_data = {"key": "value"}
-
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
-
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=json.dumps(cached_data))
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
-
-        with patch("app.services.metrics.metrics_service") as mock_metrics:
-            mock_metrics.track_cache_hit = AsyncMock()
-
-            result = await cache_service.get("test_key", track_metrics=False)
+@pytest.fixture
+def redis_from_url(monkeypatch):
+    """Patch redis.from_url in the cache module to hand out one AsyncMock client."""
+    from_url = MagicMock(return_value=AsyncMock())
+    monkeypatch.setattr("app.services.cache.redis.from_url", from_url)
+    return from_url
 
-            assert result == cached_data
-            mock_metrics.track_cache_hit.assert_not_called()
 
+@pytest.fixture
+def mock_redis(redis_from_url):
+    """The AsyncMock Redis client returned by the patched from_url."""
+    return redis_from_url.return_value
 
-@pytest.mark.asyncio
-async def test_set_with_ttl(cache_service):
-    """Test set stores data with TTL."""
-    data = {"foo": "bar"}
 
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
+@pytest.fixture
+def mock_metrics(monkeypatch):
+    """AsyncMock metrics service, picked up by CacheService's lazy import."""
+    metrics = AsyncMock()
+    monkeypatch.setattr("app.services.metrics.metrics_service", metrics)
+    return metrics
 
-        mock_redis = AsyncMock()
-        mock_redis.set = AsyncMock()
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
 
-        await cache_service.set("test_key", data, ttl=300)
+async def test_get_cache_hit(cache_service, mock_redis, mock_metrics):
+    """Test get returns cached data."""
+    mock_redis.get.return_value = _CACHED_DATA_SIMPLE_JSON
 
-        mock_redis.set.assert_called_once_with("test_key", json.dumps(data), ex=300)
+    result = await cache_service.get("test_key")
 
+    assert result == _CACHED_DATA_SIMPLE
+    mock_metrics.track_cache_hit.assert_called_once()
 
-@pytest.mark.asyncio
-async def test_set_without_ttl(cache_service):
-    """Test set stores data without TTL."""
-    data = {"foo": "bar"}
 
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
+async def test_get_cache_miss(cache_service, mock_redis, mock_metrics):
+    """Test get returns None on cache miss."""
+    mock_redis.get.return_value = None
 
-        mock_redis = AsyncMock()
-        mock_redis.set = AsyncMock()
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
+    result = await cache_service.get("missing_key")
 
-        await cache_service.set("test_key", data)
+    assert result is None
+    mock_metrics.track_cache_miss.assert_called_once()
 
-        mock_redis.set.assert_called_once_with("test_key", json.dumps(data), ex=None)
 
+async def test_get_no_metrics(cache_service, mock_redis, mock_metrics):
+    """Test get with track_metrics=False."""
+    mock_redis.get.return_value = _CACHED_DATA_SIMPLE_JSON
+
+    result = await cache_service.get("test_key", track_metrics=False)
+
+    assert result == _CACHED_DATA_SIMPLE
+    mock_metrics.track_cache_hit.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("cache_call", "redis_call"),
+    [
+        (
+            call.set("test_key", {"foo": "bar"}, ttl=300),
+            call.set("test_key", orjson.dumps({"foo": "bar"}), ex=300),
+        ),
+        (
+            call.set("test_key", {"foo": "bar"}),
+            call.set("test_key", orjson.dumps({"foo": "bar"}), ex=None),
+        ),
+        (call.delete("test_key"), call.delete("test_key")),
+    ],
+    ids=["set_with_ttl", "set_without_ttl", "delete"],
+)
+async def test_write_ops(cache_service, mock_redis, cache_call, redis_call):
+    """Test set/delete issue exactly the matching Redis command."""
+    name, args, kwargs = cache_call
+    await getattr(cache_service, name)(*args, **kwargs)
+
+    assert mock_redis.method_calls == [redis_call]
+
+
+async def test_close(cache_service, mock_redis):
+    """Test close closes Redis connection."""
+    # Initialize connection
+    await cache_service.get_client()
 
-@pytest.mark.asyncio
-async def test_delete(cache_service):
-    """Test delete removes key."""
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
+    await cache_service.close()
 
-        mock_redis = AsyncMock()
-        mock_redis.delete = AsyncMock()
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
+    mock_redis.close.assert_called_once()
 
-        await cache_service.delete("test_key")
 
-        mock_redis.delete.assert_called_once_with("test_key")
+async def test_get_client_reuses_connection(cache_service, redis_from_url):
+    """Test get_client reuses existing connection."""
+    # First call
+    client1 = await cache_service.get_client()
 
+    # Second call
+    client2 = await cache_service.get_client()
 
-@pytest.mark.asyncio
-async def test_close(cache_service):
-    """Test close closes Redis connection."""
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
+    # Should be same instance
+    assert client1 is client2
+    # from_url should only be called once
+    assert redis_from_url.call_count == 1
 
-        mock_redis = AsyncMock()
-        mock_redis.close = AsyncMock()
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
 
-        # Initialize connection
-        await cache_service.get_client()
+async def test_get_complex_data(cache_service, mock_redis, mock_metrics):
+    """Test get handles complex nested data."""
+    mock_redis.get.return_value = _CACHED_DATA_COMPLEX_JSON
 
-        await cache_service.close()
+    result = await cache_service.get("events_cache")
 
-        mock_redis.close.assert_called_once()
+    assert result == _CACHED_DATA_COMPLEX
+    assert len(result["events"]) == 2
 
 
-@pytest.mark.asyncio
-async def test_get_client_reuses_connection(cache_service):
-    """Test get_client reuses existing connection."""
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
+async def test_get_many(cache_service, mock_redis, mock_metrics):
+    """Test get_many fetches all keys in one MGET and decodes hits."""
+    mock_redis.mget.return_value = [json.dumps({"a": 1}), None]
 
-        mock_redis = AsyncMock()
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
+    result = await cache_service.get_many(["k1", "k2"])
 
-        # First call
-        client1 = await cache_service.get_client()
+    assert result == [{"a": 1}, None]
+    mock_redis.mget.assert_called_once_with(["k1", "k2"])
+    mock_metrics.track_cache_hit.assert_called_once_with(1)
+    mock_metrics.track_cache_miss.assert_called_once_with(1)
 
-        # Second call
-        client2 = await cache_service.get_client()
 
-        # Should be same instance
-        assert client1 is client2
-        # from_url should only be called once
-        assert mock_redis_module.from_url.call_count == 1
+async def test_get_raw_returns_undecoded(cache_service, mock_redis):
+    """Test get_raw returns the stored JSON document without decoding it."""
+    raw = '{"market":"totals"}'
+    mock_redis.get.return_value = raw
 
+    result = await cache_service.get_raw("odds_key", track_metrics=False)
 
-@pytest.mark.asyncio
-async def test_get_complex_data(cache_service):
-    """Test get handles complex nested data."""
-    cached_data = {
-        "events": [
-            {"id": "1", "home": "Team A", "away": "Team B"},
-            {"id": "2", "home": "Team C", "away": "Team D"},
-        ],
-        "pagination": {"total": 2, "limit": 10},
-    }
-
-    with (
-        patch("app.services.cache.redis") as mock_redis_module,
-        patch("app.services.cache.settings") as mock_settings,
-    ):
-        mock_settings.redis_url = "redis://localhost:6379/0"
-
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=json.dumps(cached_data))
-        mock_redis_module.from_url = MagicMock(return_value=mock_redis)
-
-        with patch("app.services.metrics.metrics_service") as mock_metrics:
-            mock_metrics.track_cache_hit = AsyncMock()
-
-            result = await cache_service.get("events_cache")
-
-            assert result == cached_data
-            assert len(result["events"]) == 2
+    assert result == raw
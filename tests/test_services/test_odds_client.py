@@ -1,65 +1,240 @@
 """Tests for OddsAPIClient service."""
 
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
 from app.exceptions import ProviderError, ProviderTimeoutError, RateLimitError
-from app.services.odds_client import OddsAPIClient
+from app.services.odds_client import OddsAPIClient, _parse_ts
 
+SPORTS_URL = "https://api.test.com/v3/sports"
 
-@pytest.fixture
-def odds_client():
-    """Create OddsAPIClient instance."""
+
+@pytest.fixture(scope="module", autouse=True)
+def odds_settings():
+    """Patch the odds client settings once for the whole module."""
     with patch("app.services.odds_client.settings") as mock_settings:
         mock_settings.odds_api_base_url = "https://api.test.com/v3"
         mock_settings.odds_api_key = "test_api_key"
         mock_settings.cache_ttl_sports = 86400
         mock_settings.cache_ttl_events = 300
+        mock_settings.cache_stale_ttl = 3600
+        mock_settings.cache_ttl_latency_factor = 5.0
+        mock_settings.cache_ttl_max = 86400
         mock_settings.bookmakers_list = ["bet365", "betano"]
-        yield OddsAPIClient()
+        yield mock_settings
+
+
+@pytest.fixture
+async def odds_client():
+    """Create a fresh OddsAPIClient (its HTTP client, local cache and rate limit are per test)."""
+    client = OddsAPIClient()
+    yield client
+    await client.close()
 
 
-@pytest.mark.asyncio
-async def test_request_success(odds_client):
+async def test_request_success(odds_client, mock_httpx):
     """Test _request makes successful HTTP call."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = [{"id": "123"}]
-    mock_response.raise_for_status = MagicMock()
+    route = mock_httpx.get(SPORTS_URL).respond(json=[{"id": "123"}])
+
+    with patch("app.services.odds_client.metrics_service") as mock_metrics:
+        mock_metrics.track_api_call = AsyncMock()
+
+        result = await odds_client._request("/sports")
+
+    assert result == [{"id": "123"}]
+    assert route.call_count == 1
+
+
+async def test_request_reuses_client(odds_client, mock_httpx):
+    """Test consecutive requests share one HTTP client (and its connection pool)."""
+    route = mock_httpx.get(SPORTS_URL).respond(json=[{"id": "123"}])
 
     with (
-        patch("httpx.AsyncClient") as mock_client_class,
-        patch("app.services.odds_client.cache_service") as mock_cache,
+        patch("app.services.odds_client.httpx.AsyncClient", wraps=httpx.AsyncClient) as new_client,
         patch("app.services.odds_client.metrics_service") as mock_metrics,
     ):
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_class.return_value.__aexit__ = AsyncMock()
-
-        mock_cache.get = AsyncMock(return_value=None)
-        mock_cache.set = AsyncMock()
         mock_metrics.track_api_call = AsyncMock()
 
-        result = await odds_client._request("/sports")
+        await odds_client._request("/sports")
+        await odds_client._request("/sports")
 
-        assert result == [{"id": "123"}]
-        mock_client.get.assert_called_once()
+    assert route.call_count == 2
+    assert route.calls.last.request.url.params["apiKey"] == "test_api_key"
+    new_client.assert_called_once()
+    assert new_client.call_args.kwargs["http2"] is True
 
 
-@pytest.mark.asyncio
 async def test_request_with_cache_hit(odds_client):
     """Test _request returns cached data."""
     with patch("app.services.odds_client.cache_service") as mock_cache:
-        mock_cache.get = AsyncMock(return_value=[{"cached": True}])
+        mock_cache.get = AsyncMock(
+            return_value={"data": [{"cached": True}], "fresh_until": time.time() + 60}
+        )
+
+        result = await odds_client._request("/sports", cache_key="sports:all")
+
+        assert result == [{"cached": True}]
+
+
+async def test_request_local_cache_hit_skips_redis(odds_client):
+    """Test a fresh metadata entry is served from process memory on the next call."""
+    with patch("app.services.odds_client.cache_service") as mock_cache:
+        mock_cache.get = AsyncMock(
+            return_value={"data": [{"cached": True}], "fresh_until": time.time() + 60}
+        )
+
+        first = await odds_client._request("/sports", cache_key="sports:all")
+        second = await odds_client._request("/sports", cache_key="sports:all")
+
+        assert first == second == [{"cached": True}]
+        mock_cache.get.assert_awaited_once()
+        assert odds_client._client is None
+
+
+async def test_request_local_cache_skips_other_endpoints(odds_client):
+    """Test short-lived endpoints always go back to Redis."""
+    with patch("app.services.odds_client.cache_service") as mock_cache:
+        mock_cache.get = AsyncMock(
+            return_value={"data": {"id": "evt_123"}, "fresh_until": time.time() + 60}
+        )
+
+        await odds_client._request("/events/evt_123", cache_key="event:evt_123")
+        await odds_client._request("/events/evt_123", cache_key="event:evt_123")
+
+        assert mock_cache.get.await_count == 2
+
+
+async def test_request_local_cache_drops_expired_entries(odds_client):
+    """Test an expired in-memory entry is evicted and Redis is consulted again."""
+    odds_client._local_cache["sports:all"] = {"data": [], "fresh_until": time.time() - 1}
+    with patch("app.services.odds_client.cache_service") as mock_cache:
+        mock_cache.get = AsyncMock(return_value=None)
+        mock_cache.set = AsyncMock()
+
+        with patch.object(odds_client, "_fetch", AsyncMock(side_effect=ProviderError("down"))):
+            with pytest.raises(ProviderError):
+                await odds_client._request("/sports", cache_key="sports:all")
+
+        assert "sports:all" not in odds_client._local_cache
+        mock_cache.get.assert_awaited_once()
+
+
+async def test_remember_evicts_least_recently_used(odds_client):
+    """Test the in-memory cache stays bounded, evicting the least recently read entry."""
+    entry = {"data": [], "fresh_until": time.time() + 60}
+    with patch("app.services.odds_client._LOCAL_CACHE_SIZE", 2):
+        odds_client._remember("/leagues", "leagues:a", entry)
+        odds_client._remember("/leagues", "leagues:b", entry)
+        await odds_client._request("/leagues", cache_key="leagues:a")
+        odds_client._remember("/leagues", "leagues:c", entry)
+
+    assert list(odds_client._local_cache) == ["leagues:a", "leagues:c"]
+
+
+async def test_request_stale_cache_refreshes_in_background(odds_client):
+    """Test _request serves a stale entry and refreshes it in the background."""
+    with (
+        patch("app.services.odds_client.cache_service") as mock_cache,
+        patch.object(odds_client, "_fetch", AsyncMock(return_value=[{"fresh": True}])) as mock_fetch,
+    ):
+        entry = {"data": [{"cached": True}], "fresh_until": time.time() - 1}
+        mock_cache.get = AsyncMock(return_value=entry)
+
+        result = await odds_client._request("/sports", cache_key="sports:all", cache_ttl=60)
+        await asyncio.gather(*odds_client._background_tasks)
+
+        assert result == [{"cached": True}]
+        mock_fetch.assert_awaited_once_with("/sports", None, "sports:all", 60, entry)
+
+
+async def test_fetch_not_modified_reuses_cached_body(odds_client, mock_httpx):
+    """Test a 304 for a cached ETag reuses the cached body and refreshes the entry."""
+    route = mock_httpx.get(SPORTS_URL).respond(304, headers={"ETag": '"abc"'})
+    cached = {"data": [{"cached": True}], "fresh_until": time.time() - 1, "etag": '"abc"'}
+
+    with (
+        patch("app.services.odds_client.cache_service") as mock_cache,
+        patch("app.services.odds_client.metrics_service") as mock_metrics,
+    ):
+        mock_cache.set = AsyncMock()
+        mock_metrics.track_api_call = AsyncMock()
+
+        result = await odds_client._fetch("/sports", None, "sports:all", 60, cached)
+
+        assert result == [{"cached": True}]
+        assert route.calls.last.request.headers["If-None-Match"] == '"abc"'
+        stored = mock_cache.set.call_args.args[1]
+        assert stored["etag"] == '"abc"'
+        assert stored["fresh_until"] > time.time()
+
+
+async def test_fetch_not_modified_without_etag_keeps_cached_etag(odds_client, mock_httpx):
+    """Test a 304 that omits the ETag header keeps the cached ETag for the next revalidation."""
+    mock_httpx.get(SPORTS_URL).respond(304)
+    cached = {"data": [{"cached": True}], "fresh_until": time.time() - 1, "etag": '"abc"'}
+
+    with (
+        patch("app.services.odds_client.cache_service") as mock_cache,
+        patch("app.services.odds_client.metrics_service") as mock_metrics,
+    ):
+        mock_cache.set = AsyncMock()
+        mock_metrics.track_api_call = AsyncMock()
+
+        await odds_client._fetch("/sports", None, "sports:all", 60, cached)
+
+        assert mock_cache.set.call_args.args[1]["etag"] == '"abc"'
+
+
+async def test_fetch_rate_limit_blocks_following_calls(odds_client, mock_httpx):
+    """Test a 429 makes later calls fail fast until Retry-After has elapsed."""
+    route = mock_httpx.get(SPORTS_URL).respond(
+        429, headers={"Retry-After": "30"}
+    )
+
+    with patch("app.services.odds_client.metrics_service") as mock_metrics:
+        mock_metrics.track_api_call = AsyncMock()
+
+        with pytest.raises(RateLimitError):
+            await odds_client._fetch("/sports")
+        with pytest.raises(RateLimitError) as exc_info:
+            await odds_client._fetch("/sports")
+
+    assert route.call_count == 1
+    assert 0 < exc_info.value.retry_after <= 30
+
+
+async def test_request_falls_back_to_stale_cache_on_error(odds_client):
+    """Test _request serves the stale entry when Odds-API.io is unavailable."""
+    with (
+        patch("app.services.odds_client.cache_service") as mock_cache,
+        patch.object(
+            odds_client,
+            "_fetch",
+            AsyncMock(side_effect=ProviderTimeoutError("timed out", endpoint="/sports")),
+        ),
+    ):
+        mock_cache.get = AsyncMock(
+            return_value={"data": [{"cached": True}], "fresh_until": time.time() - 1}
+        )
 
         result = await odds_client._request("/sports", cache_key="sports:all")
 
         assert result == [{"cached": True}]
 
 
+def test_effective_ttl_extends_for_slow_responses(odds_client):
+    """Test slow upstream responses are cached longer, within bounds."""
+    assert odds_client._effective_ttl(30, 0.2) == 30
+    assert odds_client._effective_ttl(30, 12.0) == 60
+    assert odds_client._effective_ttl(86400, 30.0) == 86400
+
+
 def test_provider_timeout_error_structure():
     """Test ProviderTimeoutError has correct structure."""
     error = ProviderTimeoutError(
@@ -103,7 +278,6 @@ def test_provider_error_structure():
     assert error.details["status_code"] == 500
 
 
-@pytest.mark.asyncio
 async def test_get_sports(odds_client):
     """Test get_sports returns sports list."""
     sports_data = [{"name": "Football", "slug": "football", "active": True}]
@@ -115,7 +289,6 @@ async def test_get_sports(odds_client):
         assert result[0]["name"] == "Football"
 
 
-@pytest.mark.asyncio
 async def test_get_bookmakers(odds_client):
     """Test get_bookmakers returns bookmakers list."""
     bookmakers_data = [{"key": "bet365", "name": "Bet365"}]
@@ -127,7 +300,29 @@ async def test_get_bookmakers(odds_client):
         assert result[0]["key"] == "bet365"
 
 
-@pytest.mark.asyncio
+async def test_prime_metadata(odds_client):
+    """Test prime_metadata uses one MGET, keeps hits in memory and only fetches missing keys."""
+    fresh = {"data": [{"slug": "football"}], "fresh_until": time.time() + 60}
+    with (
+        patch("app.services.odds_client.cache_service") as mock_cache,
+        patch.object(odds_client, "get_bookmakers", AsyncMock(return_value=[{"key": "bet365"}])),
+        patch.object(odds_client, "get_leagues", AsyncMock(return_value=[])),
+        patch.object(odds_client, "get_sports", AsyncMock()) as mock_sports,
+    ):
+        mock_cache.get_many = AsyncMock(return_value=[fresh, None, None])
+
+        result = await odds_client.prime_metadata()
+
+        mock_cache.get_many.assert_awaited_once_with(["sports:all", "bookmakers:all", "leagues:all"])
+        mock_sports.assert_not_awaited()
+        assert odds_client._local_cache["sports:all"] is fresh
+        assert result == {
+            "sports": [{"slug": "football"}],
+            "bookmakers": [{"key": "bet365"}],
+            "leagues": [],
+        }
+
+
 async def test_get_events(odds_client):
     """Test get_events returns parsed events."""
     events_data = [
@@ -151,7 +346,6 @@ async def test_get_events(odds_client):
         assert events[0].home == "Team A"
 
 
-@pytest.mark.asyncio
 async def test_get_events_empty(odds_client):
     """Test get_events handles empty response."""
     with patch.object(odds_client, "_request", AsyncMock(return_value=None)):
@@ -161,7 +355,6 @@ async def test_get_events_empty(odds_client):
         assert events == []
 
 
-@pytest.mark.asyncio
 async def test_get_live_events(odds_client):
     """Test get_live_events returns live events."""
     events_data = [
@@ -187,7 +380,6 @@ async def test_get_live_events(odds_client):
         assert result[0].scores.home == 1
 
 
-@pytest.mark.asyncio
 async def test_get_leagues(odds_client):
     """Test get_leagues returns leagues list."""
     leagues_data = [{"name": "Premier League", "slug": "premier-league"}]
@@ -199,7 +391,6 @@ async def test_get_leagues(odds_client):
         assert result[0]["name"] == "Premier League"
 
 
-@pytest.mark.asyncio
 async def test_get_odds(odds_client):
     """Test get_odds returns transformed odds."""
     odds_data = {
@@ -233,7 +424,30 @@ async def test_get_odds(odds_client):
         assert result.bookmakers[0].odds.home == 1.80
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("bookmaker_count", "offloaded"),
+    [(2, False), (17, True)],
+    ids=["small_inline", "large_offloaded"],
+)
+async def test_get_odds_offloads_large_transforms(odds_client, bookmaker_count, offloaded):
+    """Test only payloads with many bookmakers are transformed in a worker thread."""
+    odds_data = {"id": "evt_123", "bookmakers": {f"Book {i}": [] for i in range(bookmaker_count)}}
+    seen_threads = []
+
+    def transform(data):
+        seen_threads.append(threading.get_ident())
+        return "transformed"
+
+    with (
+        patch.object(odds_client, "_request", AsyncMock(return_value=odds_data)),
+        patch.object(odds_client, "_transform_totals", transform),
+    ):
+        result = await odds_client.get_odds("evt_123", ["bet365"], market="totals")
+
+    assert result == "transformed"
+    assert (seen_threads[0] != threading.get_ident()) is offloaded
+
+
 async def test_get_odds_no_data(odds_client):
     """Test get_odds returns None when no data."""
     with patch.object(odds_client, "_request", AsyncMock(return_value=None)):
@@ -245,7 +459,6 @@ async def test_get_odds_no_data(odds_client):
         assert result is None
 
 
-@pytest.mark.asyncio
 async def test_transform_asian_handicap(odds_client):
     """Test _transform_asian_handicap transforms data correctly."""
     data = {
@@ -280,7 +493,6 @@ async def test_transform_asian_handicap(odds_client):
     assert result.bookmakers[0].lines[1].hdp == -0.5
 
 
-@pytest.mark.asyncio
 async def test_transform_totals(odds_client):
     """Test _transform_totals transforms data correctly."""
     data = {
@@ -310,7 +522,6 @@ async def test_transform_totals(odds_client):
     assert result.bookmakers[0].lines[0].line == 2.5
 
 
-@pytest.mark.asyncio
 async def test_transform_btts(odds_client):
     """Test _transform_btts transforms data correctly."""
     data = {
@@ -338,7 +549,6 @@ async def test_transform_btts(odds_client):
     assert result.bookmakers[0].odds.yes == 1.85
 
 
-@pytest.mark.asyncio
 async def test_get_value_bets(odds_client):
     """Test get_value_bets returns aggregated value bets."""
     value_bets_data = [
@@ -374,7 +584,6 @@ async def test_get_value_bets(odds_client):
         assert result.data[0].expected_value == 5.5
 
 
-@pytest.mark.asyncio
 async def test_get_arbitrage_bets(odds_client):
     """Test get_arbitrage_bets returns arbitrage opportunities."""
     arb_data = [
@@ -412,7 +621,6 @@ async def test_get_arbitrage_bets(odds_client):
         assert result.data[0].profit_margin == 2.5
 
 
-@pytest.mark.asyncio
 async def test_get_odds_movements(odds_client):
     """Test get_odds_movements returns movement history."""
     movements_data = {
@@ -437,3 +645,40 @@ async def test_get_odds_movements(odds_client):
         assert result.event_id == "evt_123"
         assert result.opening.home == 1.90
         assert result.latest.home == 1.80
+
+
+def test_transform_normalizes_bookmaker_key(odds_client):
+    """Test bookmaker display names are normalized to snake_case keys."""
+    data = {
+        "id": "evt_123",
+        "home": "Team A",
+        "away": "Team B",
+        "date": "2026-01-20T15:00:00Z",
+        "sport": {"slug": "football"},
+        "league": {"name": "Premier League"},
+        "bookmakers": {
+            "William Hill": [
+                {
+                    "name": "ML",
+                    "updatedAt": "2026-01-18T10:00:00Z",
+                    "odds": [{"home": "1.80", "draw": "3.50", "away": "4.20"}],
+                }
+            ]
+        },
+    }
+
+    result = odds_client._transform_odds(data, "1x2")
+
+    assert result is not None
+    assert result.bookmakers[0].key == "william_hill"
+    assert result.bookmakers[0].name == "William Hill"
+
+
+def test_parse_ts_handles_zulu_and_reuses_results():
+    """Test ISO timestamps with a trailing Z parse as UTC and repeats hit the cache."""
+    ts = "2026-01-18T10:00:00Z"
+
+    parsed = _parse_ts(ts)
+
+    assert parsed == datetime(2026, 1, 18, 10, 0, tzinfo=timezone.utc)
+    assert _parse_ts(ts) is parsed
@@ -0,0 +1,120 @@
+"""Tests for static file service."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from app.providers.odds_api import odds_api_provider
+from app.schemas import BookmakerOdds, EventData, OddsMetadata, OddsOutput, OddsValues
+from app.services.static_file import StaticFileService, _write_file
+
+
+def _odds_output(is_ended: bool) -> OddsOutput:
+    """1x2 odds for evt_123; only the ended flag varies."""
+    return OddsOutput(
+        event=EventData(
+            id="evt_123",
+            sport="football",
+            home_team="Team A",
+            away_team="Team B",
+            commence_time=datetime(2026, 1, 20, 15, 0, 0),
+        ),
+        market="1x2",
+        bookmakers=[
+            BookmakerOdds(
+                key="bet365",
+                name="Bet365",
+                odds=OddsValues(home=1.80, draw=3.50, away=4.20),
+                updated_at=datetime(2026, 1, 18, 10, 0, 0),
+            ),
+        ],
+        metadata=OddsMetadata(
+            generated_at=datetime.now(),
+            is_ended=is_ended,
+            hash="abc123",
+        ),
+    )
+
+
+@pytest.fixture
+def service(tmp_path):
+    """StaticFileService writing under tmp_path with a stubbed provider."""
+    service = StaticFileService()
+    service.static_path = tmp_path
+    service.provider = SimpleNamespace(
+        get_odds=AsyncMock(),
+        compute_hash=odds_api_provider.compute_hash,
+    )
+    return service
+
+
+@pytest.fixture
+def static_file():
+    """Static file record (and its request data) for evt_123."""
+    request_data = SimpleNamespace(
+        provider_id="evt_123",
+        market="1x2",
+        is_ended=False,
+        event_date=None,
+        last_refreshed=None,
+    )
+    return SimpleNamespace(
+        path="2026/01/odds-evt_123.json",
+        hash=None,
+        last_modified=None,
+        request_data=request_data,
+    )
+
+
+async def test_generate_skips_unchanged_odds(service, static_file):
+    """Test regenerating identical odds is detected as unchanged but still refreshed."""
+    service.provider.get_odds.return_value = _odds_output(is_ended=False)
+
+    assert await service.generate_static_file(db=None, static_file=static_file) is True
+    static_file.request_data.last_refreshed = None
+
+    assert await service.generate_static_file(db=None, static_file=static_file) is False
+    assert static_file.request_data.last_refreshed is not None
+
+
+async def test_generate_without_odds_is_not_a_refresh(service, static_file):
+    """Test a fetch that returns no odds leaves last_refreshed untouched."""
+    service.provider.get_odds.return_value = None
+
+    assert await service.generate_static_file(db=None, static_file=static_file) is False
+    assert static_file.request_data.last_refreshed is None
+
+
+async def test_generate_marks_ended_when_odds_unchanged(service, static_file):
+    """Test full time is published even when the odds stop changing."""
+    service.provider.get_odds.return_value = _odds_output(is_ended=False)
+    await service.generate_static_file(db=None, static_file=static_file)
+
+    service.provider.get_odds.return_value = _odds_output(is_ended=True)
+    updated = await service.generate_static_file(db=None, static_file=static_file)
+
+    assert updated is True
+    assert static_file.request_data.is_ended is True
+    written = orjson.loads((service.static_path / static_file.path).read_bytes())
+    assert written["isEnded"] is True
+
+
+def test_write_file_uses_unique_temp_files(tmp_path):
+    """Test concurrent writers of one file each get their own temp file."""
+    target = tmp_path / "2026" / "01" / "odds-evt_123.json"
+    barrier = threading.Barrier(8)
+
+    def write(i: int) -> None:
+        barrier.wait()
+        _write_file(target, orjson.dumps({"writer": i}))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(8)))
+
+    assert orjson.loads(target.read_bytes())["writer"] in range(8)
+    assert [p.name for p in target.parent.iterdir()] == [target.name]
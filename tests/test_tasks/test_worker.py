@@ -0,0 +1,163 @@
+"""Tests for the ARQ refresh scheduler."""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from app.models import RefreshFrequency, RequestData
+from app.tasks import worker
+from app.tasks.worker import (
+    REFRESH_SCHEDULE_KEY,
+    _schedule_refresh,
+    _seed_refresh_schedule,
+    generate_static_file_task,
+    refresh_active_odds,
+)
+
+_FILE_ID = UUID("00000000-0000-4000-8000-000000000001")
+_OTHER_FILE_ID = UUID("00000000-0000-4000-8000-000000000002")
+
+
+def _request_data(event_date: datetime | None, is_ended: bool = False, last_refreshed=None):
+    return RequestData(event_date=event_date, is_ended=is_ended, last_refreshed=last_refreshed)
+
+
+@pytest.fixture
+def redis():
+    """AsyncMock ARQ redis pool."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def db_session(monkeypatch):
+    """AsyncMock DB session returned by the worker's async_session_maker."""
+    db = AsyncMock()
+    session = MagicMock()
+    session.return_value.__aenter__.return_value = db
+    monkeypatch.setattr(worker, "async_session_maker", session)
+    return db
+
+
+async def test_refresh_active_odds_enqueues_due_files(redis):
+    """Test due files are pushed back one LIVE interval and enqueued once per file."""
+    redis.zrangebyscore.return_value = [str(_FILE_ID).encode(), str(_OTHER_FILE_ID)]
+    before = time.time()
+
+    result = await refresh_active_odds({"redis": redis})
+
+    assert result == {"enqueued": 2}
+    key, min_score, max_score = redis.zrangebyscore.call_args.args
+    assert (key, min_score) == (REFRESH_SCHEDULE_KEY, 0)
+    assert max_score >= before
+
+    retry_scores = redis.zadd.call_args.args[1]
+    live = RefreshFrequency.LIVE.get_interval_seconds()
+    assert all(score >= before + live for score in retry_scores.values())
+
+    enqueued = [(c.args, c.kwargs) for c in redis.enqueue_job.await_args_list]
+    assert enqueued == [
+        (("generate_static_file_task", _FILE_ID), {"_job_id": f"static:{_FILE_ID}"}),
+        (("generate_static_file_task", _OTHER_FILE_ID), {"_job_id": f"static:{_OTHER_FILE_ID}"}),
+    ]
+
+
+async def test_refresh_active_odds_nothing_due(redis):
+    """Test an empty schedule enqueues nothing."""
+    redis.zrangebyscore.return_value = []
+
+    result = await refresh_active_odds({"redis": redis})
+
+    assert result == {"enqueued": 0}
+    redis.zadd.assert_not_awaited()
+    redis.enqueue_job.assert_not_awaited()
+
+
+async def test_schedule_refresh_sets_next_time(redis):
+    """Test a live event is rescheduled one LIVE interval from now."""
+    before = time.time()
+
+    await _schedule_refresh(redis, _FILE_ID, _request_data(datetime.now()))
+
+    key, mapping = redis.zadd.call_args.args
+    assert key == REFRESH_SCHEDULE_KEY
+    assert mapping[str(_FILE_ID)] >= before + RefreshFrequency.LIVE.get_interval_seconds()
+    redis.zrem.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "request_data",
+    [None, _request_data(datetime.now(), is_ended=True)],
+    ids=["missing_file", "ended"],
+)
+async def test_schedule_refresh_drops_finished_files(redis, request_data):
+    """Test missing files and ended events leave the schedule."""
+    await _schedule_refresh(redis, _FILE_ID, request_data)
+
+    redis.zrem.assert_awaited_once_with(REFRESH_SCHEDULE_KEY, str(_FILE_ID))
+    redis.zadd.assert_not_awaited()
+
+
+@pytest.fixture
+def static_file(db_session, monkeypatch):
+    """Live static file loaded by generate_static_file_task, with a stubbed generator."""
+    static_file = SimpleNamespace(request_data=_request_data(datetime.now()))
+    db_session.execute.return_value.scalar_one_or_none = MagicMock(return_value=static_file)
+    generate = AsyncMock(return_value=False)
+    monkeypatch.setattr(worker.static_file_service, "generate_static_file", generate)
+    return static_file
+
+
+async def test_generate_task_reschedules_after_refresh(redis, static_file):
+    """Test a fetch with unchanged odds still counts as a refresh and is rescheduled."""
+
+    async def refresh(db, static_file, bookmakers):
+        static_file.request_data.last_refreshed = datetime.now()
+        return False
+
+    worker.static_file_service.generate_static_file.side_effect = refresh
+    before = time.time()
+
+    assert await generate_static_file_task({"redis": redis}, _FILE_ID) is False
+
+    mapping = redis.zadd.call_args.args[1]
+    assert mapping[str(_FILE_ID)] >= before + RefreshFrequency.LIVE.get_interval_seconds()
+
+
+async def test_generate_task_keeps_retry_slot_without_odds(redis, static_file):
+    """Test a fetch without odds leaves the retry slot from refresh_active_odds alone."""
+    assert await generate_static_file_task({"redis": redis}, _FILE_ID) is False
+
+    redis.zadd.assert_not_awaited()
+    redis.zrem.assert_not_awaited()
+
+
+async def test_seed_refresh_schedule_rebuilds_from_db(redis, db_session):
+    """Test seeding replaces the schedule with the next refresh of every active file."""
+    refreshed = datetime.now() - timedelta(minutes=1)
+    rows = [
+        (_FILE_ID, _request_data(datetime.now(), last_refreshed=refreshed)),
+        (_OTHER_FILE_ID, _request_data(datetime.now() - timedelta(days=2))),  # Past, not today
+    ]
+
+    async def _stream():
+        for row in rows:
+            yield row
+
+    db_session.stream.return_value = _stream()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline = MagicMock(return_value=pipe)
+
+    seeded = await _seed_refresh_schedule(redis)
+
+    assert seeded == 1
+    pipe.delete.assert_called_once_with(REFRESH_SCHEDULE_KEY)
+    live = RefreshFrequency.LIVE.get_interval_seconds()
+    pipe.zadd.assert_called_once_with(
+        REFRESH_SCHEDULE_KEY, {str(_FILE_ID): refreshed.timestamp() + live}
+    )
+    pipe.execute.assert_awaited_once()